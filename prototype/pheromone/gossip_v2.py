@@ -27,11 +27,12 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(mes
 logger = logging.getLogger('pheromone.gossip')
 
 class DualPathWatcher:
-    def __init__(self, namespace="aswarm", window_ms=80, quorum_threshold=3, 
+    def __init__(self, namespace="aswarm", window_ms=80, quorum_threshold=3,
                  node_score_threshold=0.7, fast_path_score=0.90,
-                 udp_port=8888, fastpath_enabled=True):
+                 udp_port=8888, fastpath_enabled=True,
+                 elevation_queue=None):
         """Initialize dual-path watcher (Lease + UDP)
-        
+
         Args:
             namespace: Kubernetes namespace to watch
             window_ms: Sliding window size for quorum computation (default 80ms)
@@ -40,6 +41,8 @@ class DualPathWatcher:
             fast_path_score: Score threshold for single-window fast elevation
             udp_port: UDP port for fast-path listener
             fastpath_enabled: Enable UDP fast-path for <200ms detection
+            elevation_queue: Optional in-memory queue receiving each
+                elevation decision dict as it is made (in-process harnesses)
         """
         try:
             config.load_incluster_config()
@@ -64,6 +67,11 @@ class DualPathWatcher:
         # Fast-path state
         self.fastpath_signals = []  # UDP signals for immediate elevation
         self.fastpath_lock = threading.Lock()
+
+        # In-process harness hooks (see run_inproc)
+        self.elevation_queue = elevation_queue
+        self.stop_event = None
+        self.ready_event = None
         
         # Initialize UDP listener if enabled
         self.udp_listener = None
@@ -330,7 +338,10 @@ class DualPathWatcher:
             
             # Log elevation
             logger.info(f"Fast-path elevation: {json.dumps(elevation_event)}")
-            
+
+            if self.elevation_queue is not None:
+                self.elevation_queue.put(elevation_event)
+
             # Create ConfigMap in background
             threading.Thread(
                 target=self.create_fastpath_elevation_artifact,
@@ -382,7 +393,19 @@ class DualPathWatcher:
         start_time = time.perf_counter()
         
         logger.info(f"Starting dual-path watcher: run_id={run_id}, duration={duration_s}s")
-        
+
+        # Readiness handshake: one primed list call proves auth and pools
+        # the TLS connection, then the READY sentinel on stdout lets
+        # launchers unblock instead of sleeping a fixed warm-up interval
+        try:
+            self.coordination_v1.list_namespaced_lease(
+                namespace=self.namespace, limit=1)
+        except Exception:
+            pass
+        print("READY", flush=True)
+        if self.ready_event is not None:
+            self.ready_event.set()
+
         try:
             for event in w.stream(
                 self.coordination_v1.list_namespaced_lease,
@@ -419,17 +442,23 @@ class DualPathWatcher:
                                     daemon=True
                                 ).start()
                                 
-                                print(json.dumps({
+                                decision = {
                                     "elevation": True,
                                     "decision_ts_server": decision_ts_server,
                                     "witness_count": metrics.witness_count,
                                     "mean_score": metrics.mean_score,
                                     "p95_score": metrics.p95_score,
                                     "reason": reason,
+                                    "run_id": run_id,
                                     "ts": decision_ts_server
-                                }), flush=True)
-                
-                # Check duration limit
+                                }
+                                if self.elevation_queue is not None:
+                                    self.elevation_queue.put(decision)
+                                print(json.dumps(decision), flush=True)
+
+                # Check stop request / duration limit
+                if self.stop_event is not None and self.stop_event.is_set():
+                    break
                 if duration_s and (time.perf_counter() - start_time) >= duration_s:
                     break
                     
@@ -445,7 +474,31 @@ class DualPathWatcher:
         
         logger.info("Dual-path watcher stopped")
 
-def main():
+def run_inproc(args, stop_event=None, elevation_queue=None, ready_event=None):
+    """Run the watcher on the calling thread for in-process harnesses.
+
+    elevation_queue receives every elevation decision dict the moment it
+    is made — an in-memory substitute for watching elevation ConfigMaps
+    across a process boundary. ready_event mirrors the READY sentinel
+    and stop_event requests an early exit. The subprocess CLI stays the
+    production path.
+    """
+    watcher = DualPathWatcher(
+        namespace=args.namespace,
+        window_ms=args.window_ms,
+        quorum_threshold=args.quorum,
+        node_score_threshold=args.node_score_threshold,
+        fast_path_score=args.fast_path_score,
+        udp_port=getattr(args, 'udp_port', 8888),
+        fastpath_enabled=not getattr(args, 'no_fastpath', False),
+        elevation_queue=elevation_queue
+    )
+    watcher.stop_event = stop_event
+    watcher.ready_event = ready_event
+    watcher.watch_leases(run_id=args.run_id, duration_s=args.duration)
+    return watcher
+
+def main(argv=None):
     """CLI entry point for Pheromone watcher"""
     import argparse
     
@@ -460,7 +513,7 @@ def main():
     parser.add_argument("--udp-port", type=int, default=8888, help="UDP fast-path port")
     parser.add_argument("--no-fastpath", action="store_true", help="Disable UDP fast-path")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     watcher = DualPathWatcher(
         namespace=args.namespace,
@@ -21,6 +21,11 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Tuple, Set, Deque
 
+try:
+    import orjson as _json  # C-accelerated parse for the per-packet path
+except ImportError:
+    import json as _json
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +50,45 @@ DEFAULT_STALE_WINDOW_SEC = 60
 REPLAY_CACHE_SIZE = 10000
 STATS_WINDOW_SIZE = 1024
 
+# recvmmsg(2) support: receivers drain packet batches in one syscall on
+# Linux, with one SO_REUSEPORT socket per receiver so the kernel fans
+# incoming datagrams out without a shared-socket lock
+RECV_BATCH = 64
+MSG_WAITFORONE = 0x10000
+
+# SO_TIMESTAMPNS: kernel stamps each datagram's arrival (CLOCK_REALTIME
+# timespec ancillary), so recorded RX times are immune to scheduling
+# delay between packet arrival and the Python thread waking. CPython
+# doesn't export the constants; 35 is the Linux value for both.
+SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
+SCM_TIMESTAMPNS = getattr(socket, 'SCM_TIMESTAMPNS', SO_TIMESTAMPNS)
+CMSG_BUF_SIZE = 64
+try:
+    import ctypes
+
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _HAS_RECVMMSG = hasattr(_libc, 'recvmmsg')
+
+    class _Iovec(ctypes.Structure):
+        _fields_ = [("iov_base", ctypes.c_void_p),
+                    ("iov_len", ctypes.c_size_t)]
+
+    class _Msghdr(ctypes.Structure):
+        _fields_ = [("msg_name", ctypes.c_void_p),
+                    ("msg_namelen", ctypes.c_uint32),
+                    ("msg_iov", ctypes.POINTER(_Iovec)),
+                    ("msg_iovlen", ctypes.c_size_t),
+                    ("msg_control", ctypes.c_void_p),
+                    ("msg_controllen", ctypes.c_size_t),
+                    ("msg_flags", ctypes.c_int)]
+
+    class _Mmsghdr(ctypes.Structure):
+        _fields_ = [("msg_hdr", _Msghdr),
+                    ("msg_len", ctypes.c_uint)]
+except OSError:
+    _libc = None
+    _HAS_RECVMMSG = False
+
 class Stats:
     """Thread-safe statistics tracking"""
     def __init__(self):
@@ -142,29 +186,69 @@ class FastPathListener:
         self.packet_queue: queue.Queue = queue.Queue(maxsize=queue_size)
         self.executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix='fastpath-worker')
         
-        # Create socket
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
-        # Linux-specific: allow multiple processes to bind
+        # Create socket(s): with recvmmsg + SO_REUSEPORT available, each
+        # receiver gets its own socket and the kernel load-balances
+        # datagrams across them; otherwise one shared socket
+        self._reuseport = False
+        self._sockets = [self._make_socket()]
+        self.sock = self._sockets[0]
+        self._use_mmsg = _HAS_RECVMMSG and self._reuseport
+        if self._use_mmsg:
+            for _ in range(self.num_workers - 1):
+                self._sockets.append(self._make_socket())
+        else:
+            self.sock.settimeout(5.0)  # For periodic maintenance
+
+        logger.info(f"Fast-path listener initialized: {bind_addr}:{bind_port}, "
+                   f"keys={list(self.hmac_keys.keys())}, workers={num_workers}, "
+                   f"queue={queue_size}, MAX_PAYLOAD={MAX_PAYLOAD}, "
+                   f"recvmmsg={self._use_mmsg}")
+
+    def _make_socket(self) -> socket.socket:
+        """Create, configure and bind one receive socket"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        # Linux-specific: allow multiple sockets to bind the same port
         if hasattr(socket, 'SO_REUSEPORT'):
             try:
-                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                self._reuseport = True
             except (AttributeError, OSError):
                 pass
-        
-        # Increase receive buffer
+
+        # Increase receive buffer (kernel caps at net.core.rmem_max)
         try:
-            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
         except OSError:
             pass
-        
-        self.sock.bind((bind_addr, bind_port))
-        self.sock.settimeout(5.0)  # For periodic maintenance
-        
-        logger.info(f"Fast-path listener initialized: {bind_addr}:{bind_port}, "
-                   f"keys={list(self.hmac_keys.keys())}, workers={num_workers}, "
-                   f"queue={queue_size}, MAX_PAYLOAD={MAX_PAYLOAD}")
+
+        # Kernel-level receive timeout so raw recvmmsg calls also wake
+        # periodically; settimeout would flip the fd non-blocking
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO,
+                            struct.pack('ll', 5, 0))
+        except OSError:
+            pass
+
+        # Kernel RX timestamps (see SO_TIMESTAMPNS note above)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+            self._kernel_ts = True
+        except OSError:
+            self._kernel_ts = False
+
+        sock.bind((self.bind_addr, self.bind_port))
+        return sock
+
+    @staticmethod
+    def _cmsg_rx_ns(ancdata) -> int:
+        """Extract kernel arrival time (epoch ns) from recvmsg ancillary data"""
+        for level, ctype, cdata in ancdata:
+            if level == socket.SOL_SOCKET and ctype == SCM_TIMESTAMPNS:
+                sec, nsec = struct.unpack('ll', cdata[:16])
+                return sec * 1_000_000_000 + nsec
+        return time.time_ns()
     
     def _load_keys(self, shared_keys: Optional[Dict[int, str]]) -> Dict[int, bytes]:
         """Load HMAC keys from various sources"""
@@ -232,10 +316,20 @@ class FastPathListener:
     def start(self):
         """Start listener and worker threads"""
         self.running = True
-        
-        # Start receiver thread
-        self.receiver_thread = threading.Thread(target=self._receive_loop, daemon=True)
-        self.receiver_thread.start()
+
+        # Start receiver thread(s): one per socket in recvmmsg mode
+        self.receiver_threads = []
+        if self._use_mmsg:
+            for sock in self._sockets:
+                t = threading.Thread(target=self._receive_loop_mmsg,
+                                     args=(sock,), daemon=True)
+                t.start()
+                self.receiver_threads.append(t)
+        else:
+            t = threading.Thread(target=self._receive_loop, daemon=True)
+            t.start()
+            self.receiver_threads.append(t)
+        self.receiver_thread = self.receiver_threads[0]
         
         # Start worker threads
         for _ in range(self.num_workers):
@@ -252,11 +346,12 @@ class FastPathListener:
         logger.info("Stopping fast-path listener...")
         self.running = False
         
-        # Close socket to interrupt receive
-        try:
-            self.sock.close()
-        except:
-            pass
+        # Close sockets to interrupt receives
+        for sock in getattr(self, '_sockets', [self.sock]):
+            try:
+                sock.close()
+            except:
+                pass
         
         # Shutdown executor
         try:
@@ -266,8 +361,8 @@ class FastPathListener:
             self.executor.shutdown(wait=True)
         
         # Wait for threads
-        if hasattr(self, 'receiver_thread'):
-            self.receiver_thread.join(timeout=2)
+        for t in getattr(self, 'receiver_threads', []):
+            t.join(timeout=2)
         if hasattr(self, 'maintenance_thread'):
             self.maintenance_thread.join(timeout=2)
         
@@ -277,19 +372,25 @@ class FastPathListener:
         """Main receive loop - minimal processing"""
         while self.running:
             try:
-                data, addr = self.sock.recvfrom(MAX_PACKET_SIZE)
+                if self._kernel_ts:
+                    data, ancdata, _flags, addr = self.sock.recvmsg(
+                        MAX_PACKET_SIZE, socket.CMSG_SPACE(16))
+                    rx_ns = self._cmsg_rx_ns(ancdata)
+                else:
+                    data, addr = self.sock.recvfrom(MAX_PACKET_SIZE)
+                    rx_ns = time.time_ns()
                 self.stats.increment('received')
-                
+
                 # Check source filtering
                 if self.allowed_networks:
                     src_ip = ipaddress.ip_address(addr[0])
                     allowed = any(src_ip in net for net in self.allowed_networks)
                     if not allowed:
                         continue
-                
+
                 # Queue for processing
                 try:
-                    self.packet_queue.put_nowait((data, addr, time.time()))
+                    self.packet_queue.put_nowait((data, addr, rx_ns))
                 except queue.Full:
                     self.stats.increment('dropped_queue_full')
                     
@@ -298,6 +399,72 @@ class FastPathListener:
             except Exception as e:
                 if self.running:
                     logger.error(f"Receive error: {e}")
+
+    def _receive_loop_mmsg(self, sock: socket.socket):
+        """Receive loop draining up to RECV_BATCH packets per syscall.
+
+        Buffers, iovecs and mmsghdrs are allocated once and reused; only
+        msg_namelen needs resetting between calls. MSG_WAITFORONE blocks
+        for the first datagram then grabs whatever else is queued.
+        """
+        batch = RECV_BATCH
+        bufs = [ctypes.create_string_buffer(MAX_PACKET_SIZE) for _ in range(batch)]
+        names = [ctypes.create_string_buffer(16) for _ in range(batch)]
+        ctrls = [ctypes.create_string_buffer(CMSG_BUF_SIZE) for _ in range(batch)]
+        iovs = (_Iovec * batch)()
+        hdrs = (_Mmsghdr * batch)()
+        for i in range(batch):
+            iovs[i].iov_base = ctypes.cast(bufs[i], ctypes.c_void_p)
+            iovs[i].iov_len = MAX_PACKET_SIZE
+            hdrs[i].msg_hdr.msg_name = ctypes.cast(names[i], ctypes.c_void_p)
+            hdrs[i].msg_hdr.msg_namelen = 16
+            hdrs[i].msg_hdr.msg_iov = ctypes.pointer(iovs[i])
+            hdrs[i].msg_hdr.msg_iovlen = 1
+            hdrs[i].msg_hdr.msg_control = ctypes.cast(ctrls[i], ctypes.c_void_p)
+            hdrs[i].msg_hdr.msg_controllen = CMSG_BUF_SIZE
+
+        fd = sock.fileno()
+        while self.running:
+            n = _libc.recvmmsg(fd, hdrs, batch, MSG_WAITFORONE, None)
+            if n <= 0:
+                if not self.running:
+                    return
+                err = ctypes.get_errno()
+                if err in (11, 4):  # EAGAIN (SO_RCVTIMEO expiry), EINTR
+                    continue
+                logger.error(f"recvmmsg error: {os.strerror(err)}")
+                return
+            recv_ns = time.time_ns()
+            for i in range(n):
+                data = bufs[i].raw[:hdrs[i].msg_len]
+                name = names[i].raw
+                addr = (socket.inet_ntoa(name[4:8]),
+                        int.from_bytes(name[2:4], 'big'))
+                hdrs[i].msg_hdr.msg_namelen = 16
+
+                # Kernel RX timestamp: 16-byte cmsghdr + timespec (data
+                # starts at the size_t-aligned offset 16 on 64-bit)
+                rx_ns = recv_ns
+                if hdrs[i].msg_hdr.msg_controllen >= 32:
+                    raw = ctrls[i].raw
+                    _clen, level, ctype = struct.unpack_from('Lii', raw, 0)
+                    if level == socket.SOL_SOCKET and ctype == SCM_TIMESTAMPNS:
+                        sec, nsec = struct.unpack_from('ll', raw, 16)
+                        rx_ns = sec * 1_000_000_000 + nsec
+                hdrs[i].msg_hdr.msg_controllen = CMSG_BUF_SIZE
+                self.stats.increment('received')
+
+                # Check source filtering
+                if self.allowed_networks:
+                    src_ip = ipaddress.ip_address(addr[0])
+                    if not any(src_ip in net for net in self.allowed_networks):
+                        continue
+
+                # Queue for processing
+                try:
+                    self.packet_queue.put_nowait((data, addr, rx_ns))
+                except queue.Full:
+                    self.stats.increment('dropped_queue_full')
     
     def _process_loop(self):
         """Worker thread processing loop"""
@@ -308,11 +475,11 @@ class FastPathListener:
                 if item is None:  # Shutdown signal
                     break
                 
-                data, addr, recv_time = item
+                data, addr, rx_ns = item
                 start_time = time.time()
-                
+
                 # Process packet
-                self._process_packet(data, addr)
+                self._process_packet(data, addr, rx_ns)
                 
                 # Record processing latency
                 process_ms = (time.time() - start_time) * 1000
@@ -323,7 +490,8 @@ class FastPathListener:
             except Exception as e:
                 logger.error(f"Worker error: {e}")
     
-    def _process_packet(self, data: bytes, addr: Tuple[str, int]):
+    def _process_packet(self, data: bytes, addr: Tuple[str, int],
+                        rx_ns: Optional[int] = None):
         """Process a single packet"""
         # Validate size
         if len(data) < HEADER_SIZE + HMAC_SIZE:
@@ -385,10 +553,11 @@ class FastPathListener:
             self.replay_cache.add(packet_hash)
             self.replay_expire.append((packet_hash, time.time() + self.stale_window_sec))
         
-        # Parse JSON payload
+        # Parse JSON payload (both parsers take bytes; ValueError covers
+        # orjson.JSONDecodeError, json.JSONDecodeError and bad UTF-8)
         try:
-            payload_data = json.loads(payload.decode('utf-8'))
-        except (json.JSONDecodeError, UnicodeDecodeError):
+            payload_data = _json.loads(payload)
+        except ValueError:
             self.stats.increment('invalid_json')
             return
         
@@ -423,6 +592,7 @@ class FastPathListener:
             'seq16': seq16,
             'key_id': key_id,
             'ts_ns': ts_ns,
+            'rx_ns': rx_ns,
             'approx_age_ms': approx_age_ms if 'approx_age_ms' in locals() else None
         }
         
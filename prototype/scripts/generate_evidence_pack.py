@@ -7,8 +7,11 @@ import os
 import sys
 import json
 import zipfile
+import random
 import statistics
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
@@ -22,6 +25,40 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+try:
+    import orjson  # C encoder: ~5-10x faster than stdlib json, emits bytes
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # O(N) order statistics for large metric sets
+except ImportError:
+    np = None
+
+# Module-scope generator for synthetic demo data; numpy emits the whole
+# sample in one C call instead of a Python loop of random.uniform
+_RNG = np.random.default_rng() if np is not None else None
+
+try:
+    import zstandard  # dictionary compression for the near-identical certs
+except ImportError:
+    zstandard = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_ts  # C parser, ~15x stdlib
+except ImportError:
+    _parse_ts = datetime.fromisoformat  # handles 'Z' natively on 3.11+
+
+# Shared decoder bound once: orjson's C loader when present, otherwise a
+# preallocated stdlib decoder (json.loads constructs one per call)
+_json_loads = orjson.loads if orjson is not None else json.JSONDecoder().decode
+
+# ConfigMap name prefixes, hoisted so the classification pass allocates no
+# per-item strings for prefix checks or run-id extraction
+_ELEV_PREFIX = "aswarm-elevated-"
+_START_PREFIX = "aswarm-anomaly-start-"
+_START_PREFIX_LEN = len(_START_PREFIX)
+
 @dataclass
 class MTTDMetrics:
     """MTTD (Mean Time To Detect) metrics"""
@@ -52,6 +89,13 @@ class BlastRadiusMetrics:
     reduction_percentage: float
     containment_time_ms: float
 
+# Prefer zstd (3.14+) for ~2-3x faster compression at similar ratio on JSON;
+# otherwise deflate at level 1, which is ~3x faster than the default level 6
+if hasattr(zipfile, "ZIP_ZSTANDARD"):
+    _ZIP_COMPRESSION, _ZIP_COMPRESSLEVEL = zipfile.ZIP_ZSTANDARD, 3
+else:
+    _ZIP_COMPRESSION, _ZIP_COMPRESSLEVEL = zipfile.ZIP_DEFLATED, 1
+
 def _pct(sorted_vals, p):
     """Calculate percentile using nearest-rank method"""
     if not sorted_vals: 
@@ -61,12 +105,173 @@ def _pct(sorted_vals, p):
     idx = max(0, min(n-1, round((p/100.0) * (n-1))))
     return float(sorted_vals[idx])
 
-def _sha256_bytes(b: bytes) -> str:
-    """Calculate SHA256 hash of bytes"""
+def _sha256_bytes(b) -> str:
+    """One-shot SHA256 of any bytes-like object (bytes/bytearray/memoryview)"""
+    return hashlib.sha256(b).hexdigest()
+
+def _iter_json(obj) -> Any:
+    """Encode obj as indented JSON chunks (one bytes chunk under orjson)"""
+    if orjson is not None:
+        return (orjson.dumps(obj, option=orjson.OPT_INDENT_2),)
+    return json.JSONEncoder(indent=2).iterencode(obj)
+
+def _dumps_line(obj) -> str:
+    """Compact single-line JSON for NDJSON exports"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _write_hashed(zf: zipfile.ZipFile, path: str, chunks, compress_type=None) -> str:
+    """Stream chunks into a zip entry, hashing them as they are written.
+
+    Avoids materializing each file three times (str + encoded bytes + zip
+    copy); peak memory is one chunk. Returns the SHA256 hex digest for the
+    manifest. compress_type overrides the archive default (e.g. ZIP_STORED
+    for payloads that are already compressed).
+    """
     h = hashlib.sha256()
-    h.update(b)
+    info = zipfile.ZipInfo(path)
+    info.compress_type = zf.compression if compress_type is None else compress_type
+    info._compresslevel = zf.compresslevel
+    with zf.open(info, 'w', force_zip64=True) as fh:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            view = memoryview(chunk)  # hash and write share one buffer, no copies
+            h.update(view)
+            fh.write(view)
     return h.hexdigest()
 
+# KPI report template, parsed once at import; substitution cost is then
+# proportional to the placeholder count, not the template size
+import string as _string
+_HTML_TEMPLATE = _string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>A-SWARM Pilot Evidence Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }
+        .header { background: #2c3e50; color: white; padding: 20px; margin: -40px -40px 20px; }
+        .kpi-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin: 30px 0; }
+        .kpi-card { 
+            background: white; 
+            padding: 20px; 
+            border-radius: 8px; 
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .kpi-value { font-size: 36px; font-weight: bold; color: #2c3e50; }
+        .kpi-label { color: #7f8c8d; margin-top: 10px; }
+        .status-good { color: #27ae60; }
+        .status-warning { color: #f39c12; }
+        .status-bad { color: #e74c3c; }
+        .chart-container { background: white; padding: 20px; border-radius: 8px; margin: 20px 0; }
+        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #ecf0f1; font-weight: bold; }
+        .footer { text-align: center; color: #7f8c8d; margin-top: 40px; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>A-SWARM Pilot Evidence Report</h1>
+        <p>Autonomic Defense System Performance Metrics</p>
+        <p>Generated: ${timestamp}</p>
+    </div>
+    
+    <h2>Executive Summary</h2>
+    <p>The A-SWARM autonomic defense system demonstrates reliable sub-2-second threat detection and response, 
+    with ${mttd_success_rate}% detection reliability across all test scenarios.</p>
+    
+    <div class="kpi-grid">
+        <div class="kpi-card">
+            <div class="kpi-value ${mttd_status}">${mttd_p95}ms</div>
+            <div class="kpi-label">P95 MTTD<br>(Mean Time To Detect)</div>
+        </div>
+        <div class="kpi-card">
+            <div class="kpi-value ${mttr_status}">${mttr_p95}ms</div>
+            <div class="kpi-label">P95 MTTR<br>(Mean Time To Respond)</div>
+        </div>
+        <div class="kpi-card">
+            <div class="kpi-value status-good">94%</div>
+            <div class="kpi-label">Blast Radius<br>Reduction</div>
+        </div>
+    </div>
+    
+    <h2>Detailed Metrics</h2>
+    <table>
+        <tr>
+            <th>Metric</th>
+            <th>P50 (Median)</th>
+            <th>P95</th>
+            <th>P99</th>
+            <th>Min</th>
+            <th>Max</th>
+            <th>Success Rate</th>
+        </tr>
+        <tr>
+            <td>MTTD (ms)</td>
+            <td>${mttd_p50}</td>
+            <td>${mttd_p95}</td>
+            <td>${mttd_p99}</td>
+            <td>${mttd_min}</td>
+            <td>${mttd_max}</td>
+            <td>${mttd_success_rate}%</td>
+        </tr>
+        <tr>
+            <td>MTTR (ms)</td>
+            <td>${mttr_p50}</td>
+            <td>${mttr_p95}</td>
+            <td>${mttr_p99}</td>
+            <td>${mttr_min}</td>
+            <td>${mttr_max}</td>
+            <td>${mttr_success_rate}%</td>
+        </tr>
+    </table>
+    
+    <h2>Decision Path Breakdown</h2>
+    <table>
+        <tr>
+            <th>Path</th>
+            <th>Usage</th>
+            <th>Typical Latency</th>
+        </tr>
+        <tr>
+            <td>Lease-based (current)</td>
+            <td>100%</td>
+            <td>~1500ms</td>
+        </tr>
+        <tr>
+            <td>UDP Fast Path (available)</td>
+            <td>0%</td>
+            <td>&lt;200ms</td>
+        </tr>
+    </table>
+    
+    <h2>Key Achievements</h2>
+    <ul>
+        <li>✅ <strong>${mttd_success_rate}% Detection Rate</strong>: All coordinated anomalies detected reliably</li>
+        <li>✅ <strong>Sub-2s Response</strong>: P95 MTTR consistently under ${mttr_p95}ms</li>
+        <li>✅ <strong>Minimal False Positives</strong>: Ring-based approach ensures safety</li>
+        <li>✅ <strong>Signed Evidence Trail</strong>: All actions produce cryptographic certificates</li>
+    </ul>
+    
+    <h2>Architecture Highlights</h2>
+    <ul>
+        <li><strong>Lease-based Signaling</strong>: Ultra-low latency telemetry via Kubernetes primitives</li>
+        <li><strong>Distributed Quorum</strong>: Multi-node consensus prevents single-point failures</li>
+        <li><strong>Ring-based Safety</strong>: Progressive response escalation with TTL bounds</li>
+        <li><strong>Fast-path Option</strong>: UDP acceleration available for sub-200ms requirements</li>
+    </ul>
+    
+    <div class="footer">
+        <p>A-SWARM | Autonomic Defense for AI Infrastructure | Evidence Package v1.0</p>
+    </div>
+</body>
+</html>
+        """)
+
 class EvidencePackGenerator:
     def __init__(self, namespace="aswarm", run_prefix=None, expected_trials=None):
         self.namespace = namespace
@@ -91,74 +296,151 @@ class EvidencePackGenerator:
         else:
             self.v1 = None
             self.coordination_v1 = None
-    
-    def collect_mttd_metrics(self) -> Optional[MTTDMetrics]:
-        """Collect MTTD metrics from ConfigMaps"""
-        if not self.v1:
-            # Use synthetic data for demo
-            return self._generate_synthetic_mttd()
-            
-        mttd_values = []
-        try:
-            # List elevation ConfigMaps
-            cms = self.v1.list_namespaced_config_map(
-                self.namespace, 
-                label_selector="type=elevation,aswarm.ai/component=pheromone"
+
+        # Classified extraction shared by the collectors (one LIST, one pass
+        # per CLI invocation; see _classify_and_extract)
+        self._classified = None
+        self._cm_lock = threading.Lock()  # collectors may run concurrently
+
+    def _iter_cms(self):
+        """Yield the namespace's ConfigMaps one watch-cache-served page at a time.
+
+        Pages (limit=500) are discarded as they are consumed, so peak memory
+        during collection is one page rather than the namespace's full
+        ConfigMap set.
+        """
+        cont = None
+        while True:
+            resp = self.v1.list_namespaced_config_map(
+                self.namespace,
+                limit=500,
+                _continue=cont,
+                resource_version="0",
+                timeout_seconds=15
             )
-            
-            for cm in cms.items:
-                name = cm.metadata.name or ""
-                if not name.startswith("aswarm-elevated-"):
+            for cm in resp.items:
+                # Drop managedFields up front: it is often larger than the
+                # real payload and nothing here reads it
+                cm.metadata.managed_fields = None
+                yield cm
+            cont = resp.metadata._continue
+            if not cont:
+                break
+    
+    def _classify_and_extract(self) -> tuple:
+        """Single pass over the ConfigMap snapshot, dispatched by type label.
+
+        Returns (mttd_values, mttr_values, certificates) and caches the
+        result so the three collectors share one traversal instead of
+        walking the snapshot three times.
+        """
+        with self._cm_lock:
+            return self._classify_and_extract_locked()
+
+    def _classify_and_extract_locked(self) -> tuple:
+        if self._classified is not None:
+            return self._classified
+
+        start_markers = {}   # run_id -> creation_timestamp
+        elevations = []      # (run_id, t1) pairs, joined after the pass
+        mttr_values = []
+        certificates = []
+
+        for cm in self._iter_cms():
+            meta = cm.metadata
+            labels = meta.labels or {}
+            data = cm.data or {}
+            cm_type = labels.get("type")
+
+            if cm_type == "anomaly-start":
+                name = meta.name or ""
+                if name.startswith(_START_PREFIX):
+                    start_markers[name[_START_PREFIX_LEN:]] = meta.creation_timestamp
+
+            elif cm_type == "elevation" and labels.get("aswarm.ai/component") == "pheromone":
+                name = meta.name or ""
+                if not name.startswith(_ELEV_PREFIX):
                     continue
-                
                 # Prefer label filter if available
                 if self.run_prefix:
-                    labels = (cm.metadata.labels or {})
                     rp = labels.get("aswarm.ai/run-prefix", "")
                     if self.run_prefix not in (rp or name):
                         continue
-                
-                # Parse elevation data
+                raw = data.get("elevation.json")
+                if not raw:
+                    continue  # skip the parse entirely when the key is absent
                 try:
-                    elevation_data = json.loads(cm.data.get("elevation.json", "{}"))
+                    elevation_data = _json_loads(raw)
                 except Exception:
                     continue
-                
                 run_id = elevation_data.get("run_id")
-                
+                if not run_id:
+                    continue
                 # t1: decision time (preferred) or CM creation time
                 t1 = elevation_data.get("decision_ts_server")
-                if t1:
-                    t1 = datetime.fromisoformat(t1.replace('Z', '+00:00'))
-                else:
-                    t1 = cm.metadata.creation_timestamp  # already aware
-                
-                # Look for corresponding start marker
-                if run_id:
-                    start_name = f"aswarm-anomaly-start-{run_id}"
+                t1 = _parse_ts(t1) if t1 else meta.creation_timestamp  # already aware
+                elevations.append((run_id, t1))
+
+            elif cm_type == "action-certificate":
+                raw = data.get("certificate.json")
+                if not raw:
+                    continue
+                try:
+                    cert_data = _json_loads(raw)
+                except Exception:
+                    continue
+                ts = cert_data.get("timestamps", {})
+                if "detect_elevated" in ts and "actuation_effective" in ts:
                     try:
-                        start_cm = self.v1.read_namespaced_config_map(start_name, self.namespace)
-                        t0 = start_cm.metadata.creation_timestamp
-                        mttd_ms = (t1 - t0).total_seconds() * 1000.0
-                        if mttd_ms >= 0:
-                            mttd_values.append(mttd_ms)
+                        t0 = _parse_ts(ts["detect_elevated"])
+                        t1 = _parse_ts(ts["actuation_effective"])
+                        mttr_ms = (t1 - t0).total_seconds() * 1000.0
+                        if mttr_ms >= 0:
+                            mttr_values.append(mttr_ms)
                     except Exception:
-                        continue
-                        
+                        pass
+                # Add decision path if not present
+                if "decision_path" not in cert_data:
+                    cert_data["decision_path"] = "lease"
+                certificates.append(cert_data)
+
+        # Join elevations against the start-marker index
+        mttd_values = []
+        for run_id, t1 in elevations:
+            t0 = start_markers.get(run_id)
+            if t0 is None:
+                continue
+            mttd_ms = (t1 - t0).total_seconds() * 1000.0
+            if mttd_ms >= 0:
+                mttd_values.append(mttd_ms)
+
+        self._classified = (mttd_values, mttr_values, certificates)
+        return self._classified
+
+    def collect_mttd_metrics(self) -> Optional[MTTDMetrics]:
+        """Collect MTTD metrics from ConfigMaps"""
+        if not self.v1:
+            # Use synthetic data for demo
+            return self._generate_synthetic_mttd()
+
+        try:
+            mttd_values, _, _ = self._classify_and_extract()
         except Exception as e:
             print(f"Warning: Could not collect real MTTD metrics: {e}")
             return self._generate_synthetic_mttd()
-        
+
         if not mttd_values:
             return self._generate_synthetic_mttd()
-            
+
         return self._calculate_metrics(mttd_values, "MTTD")
     
     def _generate_synthetic_mttd(self) -> MTTDMetrics:
         """Generate realistic synthetic MTTD data based on our test results"""
         # Based on actual test data showing ~1.5-1.7s MTTD
-        import random
-        values = [random.uniform(1450, 1750) for _ in range(20)]
+        if _RNG is not None:
+            values = _RNG.uniform(1450.0, 1750.0, size=20).tolist()
+        else:
+            values = [random.uniform(1450, 1750) for _ in range(20)]
         return self._calculate_metrics(values, "MTTD")
     
     def collect_mttr_metrics(self) -> Optional[MTTRMetrics]:
@@ -167,31 +449,12 @@ class EvidencePackGenerator:
             # Use synthetic data for demo
             return self._generate_synthetic_mttr()
             
-        mttr_values = []
         try:
-            # List action certificate ConfigMaps
-            cms = self.v1.list_namespaced_config_map(
-                self.namespace,
-                label_selector="type=action-certificate"
-            )
-            
-            for cm in cms.items:
-                try:
-                    cert_data = json.loads(cm.data.get("certificate.json", "{}"))
-                    ts = cert_data.get("timestamps", {})
-                    
-                    if "detect_elevated" in ts and "actuation_effective" in ts:
-                        t0 = datetime.fromisoformat(ts["detect_elevated"].replace('Z', '+00:00'))
-                        t1 = datetime.fromisoformat(ts["actuation_effective"].replace('Z', '+00:00'))
-                        mttr_ms = (t1 - t0).total_seconds() * 1000.0
-                        if mttr_ms >= 0:
-                            mttr_values.append(mttr_ms)
-                except:
-                    pass
+            _, mttr_values, _ = self._classify_and_extract()
         except Exception as e:
             print(f"Warning: Could not collect real MTTR metrics: {e}")
             return self._generate_synthetic_mttr()
-        
+
         if not mttr_values:
             return self._generate_synthetic_mttr()
             
@@ -200,8 +463,10 @@ class EvidencePackGenerator:
     def _generate_synthetic_mttr(self) -> MTTRMetrics:
         """Generate realistic synthetic MTTR data"""
         # Target: P95 < 1.3s based on previous results
-        import random
-        values = [random.uniform(800, 1400) for _ in range(20)]
+        if _RNG is not None:
+            values = _RNG.uniform(800.0, 1400.0, size=20).tolist()
+        else:
+            values = [random.uniform(800, 1400) for _ in range(20)]
         return self._calculate_metrics(values, "MTTR")
     
     def _calculate_metrics(self, values: List[float], metric_type: str):
@@ -209,23 +474,39 @@ class EvidencePackGenerator:
         if not values:
             return None
             
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        
         # Calculate success rate if expected_trials is known
         success_rate = 100.0
         if self.expected_trials:
             success_rate = 100.0 * len(values) / self.expected_trials
-        
-        metrics = {
-            "raw_values": values,
-            "p50": statistics.median(sorted_values),
-            "p95": _pct(sorted_values, 95),
-            "p99": _pct(sorted_values, 99),
-            "min_value": float(sorted_values[0]),
-            "max_value": float(sorted_values[-1]),
-            "success_rate": success_rate
-        }
+
+        if np is not None and len(values) > 1:
+            # Single O(N) partition for all five order statistics instead of
+            # a full O(N log N) sort
+            arr = np.asarray(values, dtype=np.float64)
+            n = arr.size
+            idxs = np.array([0, round(0.5 * (n - 1)), round(0.95 * (n - 1)),
+                             round(0.99 * (n - 1)), n - 1])
+            part = np.partition(arr, idxs)
+            metrics = {
+                "raw_values": values,
+                "p50": float(part[idxs[1]]),
+                "p95": float(part[idxs[2]]),
+                "p99": float(part[idxs[3]]),
+                "min_value": float(part[0]),
+                "max_value": float(part[-1]),
+                "success_rate": success_rate
+            }
+        else:
+            sorted_values = sorted(values)
+            metrics = {
+                "raw_values": values,
+                "p50": statistics.median(sorted_values),
+                "p95": _pct(sorted_values, 95),
+                "p99": _pct(sorted_values, 99),
+                "min_value": float(sorted_values[0]),
+                "max_value": float(sorted_values[-1]),
+                "success_rate": success_rate
+            }
         
         if metric_type == "MTTD":
             return MTTDMetrics(**metrics)
@@ -234,38 +515,25 @@ class EvidencePackGenerator:
     
     def collect_action_certificates(self) -> List[Dict[str, Any]]:
         """Collect action certificates from the cluster"""
-        certificates = []
-        
         if not self.v1:
             # Generate sample certificates for demo
             return self._generate_sample_certificates()
-            
+
         try:
-            cms = self.v1.list_namespaced_config_map(
-                self.namespace,
-                label_selector="type=action-certificate"
-            )
-            
-            for cm in cms.items:
-                try:
-                    cert_data = json.loads(cm.data.get("certificate.json", "{}"))
-                    # Add decision path if not present
-                    if "decision_path" not in cert_data:
-                        cert_data["decision_path"] = "lease"
-                    certificates.append(cert_data)
-                except:
-                    pass
+            _, _, certificates = self._classify_and_extract()
         except Exception as e:
             print(f"Warning: Could not collect certificates: {e}")
             return self._generate_sample_certificates()
-            
+
         return certificates
     
     def _generate_sample_certificates(self) -> List[Dict[str, Any]]:
         """Generate sample action certificates for demo"""
         certificates = []
         base_time = datetime.now(timezone.utc)
-        
+        base_iso = base_time.isoformat()
+        rounded_iso = base_time.replace(microsecond=0).isoformat() + "Z"
+
         # Generate 5 sample certificates
         for i in range(5):
             cert = {
@@ -273,10 +541,10 @@ class EvidencePackGenerator:
                 "site_id": "datacenter-west-1",
                 "asset_id": f"node-{i+1}",
                 "timestamps": {
-                    "anomaly_start": base_time.isoformat(),
-                    "detect_elevated": (base_time).replace(microsecond=0).isoformat() + "Z",
-                    "actuation_start": (base_time).replace(microsecond=0).isoformat() + "Z",
-                    "actuation_effective": (base_time).replace(microsecond=0).isoformat() + "Z"
+                    "anomaly_start": base_iso,
+                    "detect_elevated": rounded_iso,
+                    "actuation_start": rounded_iso,
+                    "actuation_effective": rounded_iso
                 },
                 "policy": {
                     "policy_id": "default-containment-v1",
@@ -339,44 +607,49 @@ class EvidencePackGenerator:
         
         return chart_data
     
-    def generate_siem_exports(self, mttd_metrics: MTTDMetrics, mttr_metrics: MTTRMetrics) -> Dict[str, str]:
-        """Generate SIEM-compatible export formats"""
-        exports = {}
-        
-        # Splunk format (NDJSON for events)
-        splunk_events = []
-        for i, mttd in enumerate(mttd_metrics.raw_values[:5]):  # Sample events
-            event = {
-                "_time": datetime.now(timezone.utc).timestamp() - (300 - i*60),
-                "index": "aswarm",
-                "sourcetype": "aswarm:detection",
-                "event": {
-                    "type": "anomaly_detected",
-                    "mttd_ms": mttd,
-                    "site_id": "datacenter-west-1", 
-                    "severity": "high",
-                    "action": "pod-network-isolate"
+    def generate_siem_exports(self, mttd_metrics: MTTDMetrics, mttr_metrics: MTTRMetrics) -> Dict[str, Any]:
+        """Generate SIEM-compatible exports as NDJSON line streams.
+
+        Each value is a generator of lines consumed once by the streaming
+        zip writer, so an export is never materialized as one large string.
+        """
+        def splunk_events():
+            # Splunk format (NDJSON for events); capture the clock once
+            now_ts = datetime.now(timezone.utc).timestamp()
+            for i, mttd in enumerate(mttd_metrics.raw_values[:5]):  # Sample events
+                event = {
+                    "_time": now_ts - (300 - i*60),
+                    "index": "aswarm",
+                    "sourcetype": "aswarm:detection",
+                    "event": {
+                        "type": "anomaly_detected",
+                        "mttd_ms": mttd,
+                        "site_id": "datacenter-west-1",
+                        "severity": "high",
+                        "action": "pod-network-isolate"
+                    }
                 }
-            }
-            splunk_events.append(json.dumps(event))
-        exports["splunk_events.ndjson"] = "\n".join(splunk_events) + "\n"
-        
-        # Elasticsearch format (Bulk API)
-        elastic_bulk = []
-        for i, mttr in enumerate(mttr_metrics.raw_values[:5]):
-            # Index action
-            elastic_bulk.append(json.dumps({"index": {"_index": "aswarm-metrics"}}))
-            # Document
-            elastic_bulk.append(json.dumps({
-                "@timestamp": datetime.now(timezone.utc).isoformat(),
-                "metric_type": "mttr",
-                "value_ms": mttr,
-                "site_id": "datacenter-west-1",
-                "tags": ["autonomic", "defense", "pilot"]
-            }))
-        exports["elasticsearch_bulk.ndjson"] = "\n".join(elastic_bulk) + "\n"
-        
-        return exports
+                yield _dumps_line(event) + "\n"
+
+        def elastic_bulk():
+            # Elasticsearch format (Bulk API); capture the clock once
+            now_iso = datetime.now(timezone.utc).isoformat()
+            for i, mttr in enumerate(mttr_metrics.raw_values[:5]):
+                # Index action
+                yield _dumps_line({"index": {"_index": "aswarm-metrics"}}) + "\n"
+                # Document
+                yield _dumps_line({
+                    "@timestamp": now_iso,
+                    "metric_type": "mttr",
+                    "value_ms": mttr,
+                    "site_id": "datacenter-west-1",
+                    "tags": ["autonomic", "defense", "pilot"]
+                }) + "\n"
+
+        return {
+            "splunk_events.ndjson": splunk_events(),
+            "elasticsearch_bulk.ndjson": elastic_bulk()
+        }
     
     def generate_kpi_report_html(self, mttd: MTTDMetrics, mttr: MTTRMetrics) -> str:
         """Generate HTML KPI report"""
@@ -395,164 +668,38 @@ class EvidencePackGenerator:
         else:
             mttr_status = "status-bad"
         
-        html_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>A-SWARM Pilot Evidence Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }}
-        .header {{ background: #2c3e50; color: white; padding: 20px; margin: -40px -40px 20px; }}
-        .kpi-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin: 30px 0; }}
-        .kpi-card {{ 
-            background: white; 
-            padding: 20px; 
-            border-radius: 8px; 
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        .kpi-value {{ font-size: 36px; font-weight: bold; color: #2c3e50; }}
-        .kpi-label {{ color: #7f8c8d; margin-top: 10px; }}
-        .status-good {{ color: #27ae60; }}
-        .status-warning {{ color: #f39c12; }}
-        .status-bad {{ color: #e74c3c; }}
-        .chart-container {{ background: white; padding: 20px; border-radius: 8px; margin: 20px 0; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #ecf0f1; font-weight: bold; }}
-        .footer {{ text-align: center; color: #7f8c8d; margin-top: 40px; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>A-SWARM Pilot Evidence Report</h1>
-        <p>Autonomic Defense System Performance Metrics</p>
-        <p>Generated: {timestamp}</p>
-    </div>
-    
-    <h2>Executive Summary</h2>
-    <p>The A-SWARM autonomic defense system demonstrates reliable sub-2-second threat detection and response, 
-    with {mttd_success_rate:.0f}% detection reliability across all test scenarios.</p>
-    
-    <div class="kpi-grid">
-        <div class="kpi-card">
-            <div class="kpi-value {mttd_status}">{mttd_p95:.0f}ms</div>
-            <div class="kpi-label">P95 MTTD<br>(Mean Time To Detect)</div>
-        </div>
-        <div class="kpi-card">
-            <div class="kpi-value {mttr_status}">{mttr_p95:.0f}ms</div>
-            <div class="kpi-label">P95 MTTR<br>(Mean Time To Respond)</div>
-        </div>
-        <div class="kpi-card">
-            <div class="kpi-value status-good">94%</div>
-            <div class="kpi-label">Blast Radius<br>Reduction</div>
-        </div>
-    </div>
-    
-    <h2>Detailed Metrics</h2>
-    <table>
-        <tr>
-            <th>Metric</th>
-            <th>P50 (Median)</th>
-            <th>P95</th>
-            <th>P99</th>
-            <th>Min</th>
-            <th>Max</th>
-            <th>Success Rate</th>
-        </tr>
-        <tr>
-            <td>MTTD (ms)</td>
-            <td>{mttd_p50:.0f}</td>
-            <td>{mttd_p95:.0f}</td>
-            <td>{mttd_p99:.0f}</td>
-            <td>{mttd_min:.0f}</td>
-            <td>{mttd_max:.0f}</td>
-            <td>{mttd_success_rate:.0f}%</td>
-        </tr>
-        <tr>
-            <td>MTTR (ms)</td>
-            <td>{mttr_p50:.0f}</td>
-            <td>{mttr_p95:.0f}</td>
-            <td>{mttr_p99:.0f}</td>
-            <td>{mttr_min:.0f}</td>
-            <td>{mttr_max:.0f}</td>
-            <td>{mttr_success_rate:.0f}%</td>
-        </tr>
-    </table>
-    
-    <h2>Decision Path Breakdown</h2>
-    <table>
-        <tr>
-            <th>Path</th>
-            <th>Usage</th>
-            <th>Typical Latency</th>
-        </tr>
-        <tr>
-            <td>Lease-based (current)</td>
-            <td>100%</td>
-            <td>~1500ms</td>
-        </tr>
-        <tr>
-            <td>UDP Fast Path (available)</td>
-            <td>0%</td>
-            <td>&lt;200ms</td>
-        </tr>
-    </table>
-    
-    <h2>Key Achievements</h2>
-    <ul>
-        <li>✅ <strong>{mttd_success_rate:.0f}% Detection Rate</strong>: All coordinated anomalies detected reliably</li>
-        <li>✅ <strong>Sub-2s Response</strong>: P95 MTTR consistently under {mttr_p95:.0f}ms</li>
-        <li>✅ <strong>Minimal False Positives</strong>: Ring-based approach ensures safety</li>
-        <li>✅ <strong>Signed Evidence Trail</strong>: All actions produce cryptographic certificates</li>
-    </ul>
-    
-    <h2>Architecture Highlights</h2>
-    <ul>
-        <li><strong>Lease-based Signaling</strong>: Ultra-low latency telemetry via Kubernetes primitives</li>
-        <li><strong>Distributed Quorum</strong>: Multi-node consensus prevents single-point failures</li>
-        <li><strong>Ring-based Safety</strong>: Progressive response escalation with TTL bounds</li>
-        <li><strong>Fast-path Option</strong>: UDP acceleration available for sub-200ms requirements</li>
-    </ul>
-    
-    <div class="footer">
-        <p>A-SWARM | Autonomic Defense for AI Infrastructure | Evidence Package v1.0</p>
-    </div>
-</body>
-</html>
-        """
-        
-        return html_template.format(
+        return _HTML_TEMPLATE.substitute(
             timestamp=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
-            mttd_p95=mttd.p95,
-            mttd_p50=mttd.p50,
-            mttd_p99=mttd.p99,
-            mttd_min=mttd.min_value,
-            mttd_max=mttd.max_value,
+            mttd_p95=f"{mttd.p95:.0f}",
+            mttd_p50=f"{mttd.p50:.0f}",
+            mttd_p99=f"{mttd.p99:.0f}",
+            mttd_min=f"{mttd.min_value:.0f}",
+            mttd_max=f"{mttd.max_value:.0f}",
             mttd_status=mttd_status,
-            mttd_success_rate=mttd.success_rate,
-            mttr_p95=mttr.p95,
-            mttr_p50=mttr.p50,
-            mttr_p99=mttr.p99,
-            mttr_min=mttr.min_value,
-            mttr_max=mttr.max_value,
+            mttd_success_rate=f"{mttd.success_rate:.0f}",
+            mttr_p95=f"{mttr.p95:.0f}",
+            mttr_p50=f"{mttr.p50:.0f}",
+            mttr_p99=f"{mttr.p99:.0f}",
+            mttr_min=f"{mttr.min_value:.0f}",
+            mttr_max=f"{mttr.max_value:.0f}",
             mttr_status=mttr_status,
-            mttr_success_rate=mttr.success_rate
+            mttr_success_rate=f"{mttr.success_rate:.0f}"
         )
     
     def generate_evidence_pack(self, output_path: str = "EvidencePack.zip"):
         """Generate complete evidence pack"""
         print("=== A-SWARM Evidence Pack Generator ===")
         
-        # Collect all metrics
-        print("Collecting MTTD metrics...")
-        mttd_metrics = self.collect_mttd_metrics()
-        
-        print("Collecting MTTR metrics...")
-        mttr_metrics = self.collect_mttr_metrics()
-        
-        print("Collecting Action Certificates...")
-        certificates = self.collect_action_certificates()
+        # Collect all metrics concurrently: the collectors are independent
+        # I/O-bound phases that release the GIL on socket waits
+        print("Collecting MTTD, MTTR and Action Certificates...")
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            mttd_future = ex.submit(self.collect_mttd_metrics)
+            mttr_future = ex.submit(self.collect_mttr_metrics)
+            certs_future = ex.submit(self.collect_action_certificates)
+            mttd_metrics = mttd_future.result()
+            mttr_metrics = mttr_future.result()
+            certificates = certs_future.result()
         
         print("Generating visualizations...")
         blast_radius_chart = self.generate_blast_radius_chart()
@@ -618,47 +765,60 @@ class EvidencePackGenerator:
         print(f"\nCreating evidence pack: {output_path}")
         manifest = {}
         
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Main evidence JSON
-            evidence_json = json.dumps(evidence_pack, indent=2)
-            zf.writestr("evidence.json", evidence_json)
-            manifest["evidence.json"] = _sha256_bytes(evidence_json.encode())
-            
+        with zipfile.ZipFile(output_path, 'w', _ZIP_COMPRESSION,
+                             allowZip64=True, compresslevel=_ZIP_COMPRESSLEVEL) as zf:
+            # Main evidence JSON (streamed: encoded, hashed and written per chunk)
+            manifest["evidence.json"] = _write_hashed(zf, "evidence.json", _iter_json(evidence_pack))
+
             # KPI Report
-            zf.writestr("kpi_report.html", kpi_html)
-            manifest["kpi_report.html"] = _sha256_bytes(kpi_html.encode())
-            
-            # Individual certificates
-            for i, cert in enumerate(certificates):
-                path = f"certificates/certificate_{i+1}.json"
-                cert_json = json.dumps(cert, indent=2)
-                zf.writestr(path, cert_json)
-                manifest[path] = _sha256_bytes(cert_json.encode())
-            
-            # SIEM exports
-            for filename, content in siem_exports.items():
+            manifest["kpi_report.html"] = _write_hashed(zf, "kpi_report.html", (kpi_html,))
+
+            # Individual certificates. With zstandard available and enough
+            # samples to train on, compress them against a shared dictionary:
+            # the near-identical JSON keys mean per-file deflate spends most
+            # of its time on entropy-model cold start.
+            cert_payloads = [
+                b"".join(c if isinstance(c, bytes) else c.encode() for c in _iter_json(cert))
+                for cert in certificates
+            ]
+            dict_data = None
+            if zstandard is not None and len(cert_payloads) >= 8:
+                try:
+                    dict_data = zstandard.train_dictionary(16384, cert_payloads[:64])
+                except zstandard.ZstdError:
+                    # ZDICT refuses small or near-identical sample sets
+                    # ("Src size is incorrect"); fall back to plain deflate
+                    pass
+            if dict_data is not None:
+                cctx = zstandard.ZstdCompressor(level=3, dict_data=dict_data)
+                manifest["certificates/dict.zstd"] = _write_hashed(
+                    zf, "certificates/dict.zstd", (dict_data.as_bytes(),),
+                    compress_type=zipfile.ZIP_STORED)
+                for i, payload in enumerate(cert_payloads):
+                    path = f"certificates/certificate_{i+1}.json.zst"
+                    manifest[path] = _write_hashed(
+                        zf, path, (cctx.compress(payload),),
+                        compress_type=zipfile.ZIP_STORED)
+            else:
+                for i, payload in enumerate(cert_payloads):
+                    path = f"certificates/certificate_{i+1}.json"
+                    manifest[path] = _write_hashed(zf, path, (payload,))
+
+            # SIEM exports (line streams from generate_siem_exports)
+            for filename, lines in siem_exports.items():
                 path = f"siem_exports/{filename}"
-                zf.writestr(path, content)
-                manifest[path] = _sha256_bytes(content.encode())
-            
+                manifest[path] = _write_hashed(zf, path, lines)
+
             # Raw metrics data
-            mttd_raw_json = json.dumps({
+            manifest["metrics/mttd_raw.json"] = _write_hashed(zf, "metrics/mttd_raw.json", _iter_json({
                 "values_ms": mttd_metrics.raw_values,
                 "count": len(mttd_metrics.raw_values)
-            }, indent=2)
-            zf.writestr("metrics/mttd_raw.json", mttd_raw_json)
-            manifest["metrics/mttd_raw.json"] = _sha256_bytes(mttd_raw_json.encode())
-            
-            mttr_raw_json = json.dumps({
+            }))
+
+            manifest["metrics/mttr_raw.json"] = _write_hashed(zf, "metrics/mttr_raw.json", _iter_json({
                 "values_ms": mttr_metrics.raw_values,
                 "count": len(mttr_metrics.raw_values)
-            }, indent=2)
-            zf.writestr("metrics/mttr_raw.json", mttr_raw_json)
-            manifest["metrics/mttr_raw.json"] = _sha256_bytes(mttr_raw_json.encode())
-            
-            # Manifest with hashes
-            manifest_json = json.dumps(manifest, indent=2)
-            zf.writestr("manifest.json", manifest_json)
+            }))
             
             # README
             readme_content = f"""
@@ -716,8 +876,14 @@ For questions about this evidence pack or A-SWARM deployment, contact the soluti
 Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}
 """
             
-            zf.writestr("README.md", readme_content)
-        
+            manifest["README.md"] = _write_hashed(zf, "README.md", (readme_content,))
+
+            # Manifest with hashes, written last so it covers every entry.
+            # Hashing is fused with the streamed writes above, and sha256 and
+            # the compressor both release the GIL, so digest work already
+            # overlaps compression without a separate worker pool.
+            zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+
         # Print summary
         print(f"\n=== Evidence Pack Generated Successfully ===")
         print(f"Output: {output_path}")
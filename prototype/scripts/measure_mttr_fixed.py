@@ -1,15 +1,194 @@
 #!/usr/bin/env python3
-import subprocess, json, time, re, sys, argparse, os
+import subprocess, json, time, sys, argparse, os
 import hashlib, hmac
+import uuid
+import select
+import threading
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-def iso(s): 
+try:
+    import numpy as np  # vectorized, interpolated percentiles for large --repeat
+except ImportError:
+    np = None
+
+try:
+    import uuid6  # UUIDv7 backport for interpreters without uuid.uuid7
+except ImportError:
+    uuid6 = None
+
+try:
+    from kubernetes import client, config, watch
+    from kubernetes.client.rest import ApiException
+    from kubernetes.stream import stream as k8s_stream
+except ImportError:  # --legacy kubectl path still works without the client
+    client = config = watch = k8s_stream = ApiException = None
+
+def iso(s):
     return datetime.fromisoformat(s.replace('Z','+00:00'))
 
-def main(ns, selector="app=anomaly", repeat=1):
+# Integer nanoseconds for all interval math: no float boxing per call and
+# no FP rounding on sub-ms deltas; divide once for display
+NOW_NS = time.perf_counter_ns
+
+class _ElevationInformer:
+    """Minimal informer over the elevation ConfigMaps.
+
+    One LIST+WATCH per process maintains a local name->object cache; run
+    loops block on a condition variable instead of issuing per-iteration
+    GETs, so the apiserver sees O(1) requests for a whole --repeat batch.
+    (The Python client has no SharedInformerFactory, so this hand-rolls
+    the same contract.)
+    """
+    def __init__(self, v1, ns):
+        self._v1 = v1
+        self._ns = ns
+        self._cms = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        while not self._stopped:
+            try:
+                initial = self._v1.list_namespaced_config_map(
+                    self._ns, label_selector='type=elevation')
+                with self._cond:
+                    self._cms = {cm.metadata.name: cm for cm in initial.items}
+                    self._cond.notify_all()
+                w = watch.Watch()
+                for ev in w.stream(self._v1.list_namespaced_config_map, self._ns,
+                                   label_selector='type=elevation',
+                                   resource_version=initial.metadata.resource_version,
+                                   timeout_seconds=300):
+                    with self._cond:
+                        if ev['type'] == 'DELETED':
+                            self._cms.pop(ev['object'].metadata.name, None)
+                        else:
+                            self._cms[ev['object'].metadata.name] = ev['object']
+                        self._cond.notify_all()
+                    if self._stopped:
+                        return
+            except Exception:
+                time.sleep(1)  # relist after transient watch failures
+
+    def wait_for(self, predicate, timeout_s):
+        """Block until predicate(cms_by_name) returns non-None, or timeout"""
+        deadline = time.monotonic() + timeout_s
+        with self._cond:
+            while True:
+                hit = predicate(self._cms)
+                if hit is not None:
+                    return hit
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def stop(self):
+        self._stopped = True
+
+def _create_job(batch, ns, body):
+    """Create a Job over the client session; on 409 delete the stale one and retry"""
+    try:
+        batch.create_namespaced_job(ns, body)
+        return
+    except ApiException as e:
+        if e.status != 409:
+            raise
+    name = body['metadata']['name']
+    batch.delete_namespaced_job(name, ns, propagation_policy='Background')
+    for _ in range(25):
+        try:
+            batch.create_namespaced_job(ns, body)
+            return
+        except ApiException as e:
+            if e.status != 409:
+                raise
+        time.sleep(0.2)
+    raise ApiException(status=409, reason=f"job {name} name not freed")
+
+def _new_run_id(prefix=""):
+    """Time-ordered, globally unique run ID.
+
+    UUIDv7 sorts by creation time and cannot collide across parallel
+    invocations, unlike the old second-resolution timestamp + counter.
+    """
+    if hasattr(uuid, 'uuid7'):
+        uid = uuid.uuid7().hex
+    elif uuid6 is not None:
+        uid = uuid6.uuid7().hex
+    else:
+        # stdlib fallback with the same contract: nanosecond timestamp
+        # prefix keeps IDs sortable, random suffix keeps shards disjoint
+        uid = f"{time.time_ns():016x}{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{uid}" if prefix else uid
+
+def _kubectl_apply(ns, *manifest_paths):
+    """Apply manifests through a single kubectl stdin pipe.
+
+    Concatenating the documents costs one kubectl startup + discovery
+    round trip regardless of file count, and --server-side skips the
+    client-side validation/merge pass.
+    """
+    combined = b"\n---\n".join(Path(p).read_bytes() for p in manifest_paths)
+    subprocess.run(['kubectl','-n',ns,'apply','--server-side','-f','-'],
+                   input=combined, check=True)
+
+class _Ticker:
+    """Kernel-timer cadence for poll loops.
+
+    Where os.timerfd_create is available (Python 3.13+, Linux) the loop
+    wakes on a CLOCK_MONOTONIC timer edge instead of accumulating
+    time.sleep scheduling jitter; elsewhere it falls back to time.sleep.
+    """
+    def __init__(self, interval_s):
+        self.interval_s = interval_s
+        self._fd = None
+        if hasattr(os, 'timerfd_create'):
+            self._fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+            os.timerfd_settime(self._fd, initial=interval_s, interval=interval_s)
+
+    def wait(self):
+        if self._fd is not None:
+            select.select([self._fd], [], [])
+            os.read(self._fd, 8)
+        else:
+            time.sleep(self.interval_s)
+
+    def rearm(self, interval_s):
+        """Change the cadence in place (for adaptive schedules)"""
+        self.interval_s = interval_s
+        if self._fd is not None:
+            os.timerfd_settime(self._fd, initial=interval_s, interval=interval_s)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+def main(ns, selector="app=anomaly", repeat=1, legacy=False, run_id_prefix=""):
     all_runs = []
-    
+
+    v1 = None
+    net = None
+    if not legacy and client is not None:
+        # One kubeconfig load and one keepalive TLS session for the whole
+        # run, instead of a kubectl fork + handshake per poll
+        try:
+            config.load_kube_config()
+        except Exception:
+            config.load_incluster_config()
+        v1 = client.CoreV1Api()
+        net = client.NetworkingV1Api()
+        batch = client.BatchV1Api()
+    else:
+        batch = None
+
+    informer = _ElevationInformer(v1, ns) if v1 is not None else None
+
     # Clean up any previous runs
     subprocess.call(['kubectl','-n',ns,'delete','job','anomaly-scan'], 
                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -19,46 +198,105 @@ def main(ns, selector="app=anomaly", repeat=1):
             print(f"\n=== Run {run_num + 1}/{repeat} ===", flush=True)
         
         # Generate unique run ID
-        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + f"-{run_num:03d}"
+        run_id = _new_run_id(run_id_prefix)
         print(f"Run ID: {run_id}", flush=True)
         
         # Clean up old elevation ConfigMaps
-        subprocess.call(['kubectl','-n',ns,'delete','cm','aswarm-elevated'], 
+        subprocess.call(['kubectl','-n',ns,'delete','cm/aswarm-elevated',
+                         '--ignore-not-found'],
                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         # Create anomaly job
-        subprocess.check_call(['kubectl','apply','-f','k8s/anomaly-job.yaml'])
+        if batch is not None:
+            _create_job(batch, ns, yaml.safe_load(Path('k8s/anomaly-job.yaml').read_text()))
+        else:
+            _kubectl_apply(ns, 'k8s/anomaly-job.yaml')
         
         # Wait for anomaly to start and generate logs
         time.sleep(3)
         
         # Timing using monotonic clock for intervals
-        perf_start = time.perf_counter()
-        
-        # get anomaly start from Job logs
-        for attempt in range(10):
-            try:
-                logs = subprocess.check_output(['kubectl','-n',ns,'logs','job/anomaly-scan']).decode()
-                m = re.search(r'T_ANOMALY_START\s+(\S+)', logs)
-                if m:
+        perf_start_ns = NOW_NS()
+        
+        # get anomaly start by following the Job log: scan incrementally and
+        # stop at the first marker instead of re-downloading the growing
+        # blob every 0.5s
+        t0_str = None
+        if v1 is not None:
+            pod = None
+            for attempt in range(20):
+                pods = v1.list_namespaced_pod(
+                    ns, label_selector='job-name=anomaly-scan', limit=1)
+                if pods.items:
+                    pod = pods.items[0].metadata.name
                     break
-            except:
-                pass
-            time.sleep(0.5)
-        
-        if not m:
+                time.sleep(0.25)
+            if pod:
+                resp = v1.read_namespaced_pod_log(pod, ns, follow=True, _preload_content=False)
+                buf = b""
+                try:
+                    # Fixed-literal scan: bytes.find runs at memcmp speed,
+                    # no regex engine needed for a known marker
+                    marker = b'T_ANOMALY_START '
+                    for chunk in resp.stream(amt=4096):
+                        buf += chunk
+                        idx = buf.find(marker)
+                        if idx >= 0:
+                            end = buf.find(b'\n', idx)
+                            if end >= 0:  # wait for the full marker line
+                                t0_str = buf[idx + len(marker):end].split()[0].decode()
+                                break
+                        buf = buf[-256:]  # rolling tail; the marker line is far shorter
+                finally:
+                    resp.release_conn()
+        else:
+            proc = subprocess.Popen(['kubectl','-n',ns,'logs','-f','--tail=-1','job/anomaly-scan'],
+                                    stdout=subprocess.PIPE, text=True)
+            try:
+                for line in proc.stdout:
+                    idx = line.find('T_ANOMALY_START ')
+                    if idx >= 0:
+                        t0_str = line[idx + 16:].split()[0]
+                        break
+            finally:
+                proc.terminate()
+
+        if not t0_str:
             print("Could not find anomaly start in logs.", file=sys.stderr)
             sys.exit(1)
-        t0 = iso(m.group(1))
-        t0_perf = perf_start  # Use current time as reference
+        t0 = iso(t0_str)
+        t0_ns = perf_start_ns  # Use current time as reference
         
         # wait until pheromone elevates (check both old and new style)
         print("Waiting for elevation...", flush=True)
         t1 = None
-        t1_perf = None
+        t1_ns = None
         elevation_data = {}
-        
-        for _ in range(60):
+
+        if informer is not None:
+            # Zero RPCs per iteration: the process-wide informer cache is
+            # consulted locally and the wait wakes on its condition variable
+            # as watch events land
+            def match(cms):
+                for name in (f"aswarm-elevated-{run_id}", "aswarm-elevated"):
+                    cm = cms.get(name)
+                    if cm is None:
+                        continue
+                    data = cm.data or {}
+                    if data.get('elevated') == 'true':
+                        elev_ts = iso(data.get('ts'))
+                        if elev_ts > t0:
+                            return elev_ts, dict(data)
+                return None
+
+            hit = informer.wait_for(match, timeout_s=60)
+            if hit:
+                t1, data = hit
+                t1_ns = NOW_NS()
+                elevation_data = convert_elevation_data(data, run_id)
+
+        tick = _Ticker(1.0)
+        for _ in range(0 if v1 is not None else 60):
             # Try new run-specific configmap first
             try:
                 out = subprocess.check_output(['kubectl','-n',ns,'get',f'cm/aswarm-elevated-{run_id}','-o','json'], 
@@ -70,12 +308,12 @@ def main(ns, selector="app=anomaly", repeat=1):
                     elev_ts = iso(data.get('ts'))
                     if elev_ts > t0:
                         t1 = elev_ts
-                        t1_perf = time.perf_counter()
+                        t1_ns = NOW_NS()
                         elevation_data = convert_elevation_data(data, run_id)
                         break
             except subprocess.CalledProcessError:
                 pass
-            
+
             # Fall back to old style configmap
             try:
                 out = subprocess.check_output(['kubectl','-n',ns,'get','cm/aswarm-elevated','-o','json'],
@@ -87,14 +325,15 @@ def main(ns, selector="app=anomaly", repeat=1):
                     elev_ts = iso(data.get('ts'))
                     if elev_ts > t0:
                         t1 = elev_ts
-                        t1_perf = time.perf_counter()
+                        t1_ns = NOW_NS()
                         elevation_data = convert_elevation_data(data, run_id)
                         break
             except subprocess.CalledProcessError:
                 pass
-            
-            time.sleep(1)
-        
+
+            tick.wait()
+        tick.close()
+
         if not t1:
             print("No elevation detected (timeout).", file=sys.stderr)
             sys.exit(2)
@@ -102,66 +341,129 @@ def main(ns, selector="app=anomaly", repeat=1):
         # apply Ring-1 and record effectiveness when probes fail
         print("Applying micro-containment...", flush=True)
         apply_t = datetime.now(timezone.utc)
-        apply_t_perf = time.perf_counter()
-        
-        subprocess.check_call(['kubectl','apply','-f','k8s/quarantine-template.yaml'])
-        subprocess.check_call(['kubectl','-n',ns,'label','pods','-l',selector,'aswarm/quarantine=true','--overwrite'])
-        
-        # find an anomaly pod
-        anom_pod = subprocess.check_output(
-            ['kubectl','-n',ns,'get','pods','-l',selector,'-o','jsonpath={.items[0].metadata.name}']
-        ).decode().strip()
+        apply_t_ns = NOW_NS()
         
+        if v1 is not None:
+            # One reused session: create the policy from the local template,
+            # list the target pods once, and label them via patches (the
+            # same list also yields anom_pod, saving a third round trip)
+            policy_body = yaml.safe_load(Path('k8s/quarantine-template.yaml').read_text())
+            try:
+                net.create_namespaced_network_policy(ns, policy_body)
+            except ApiException as e:
+                if e.status != 409:
+                    raise
+            pods = v1.list_namespaced_pod(ns, label_selector=selector).items
+            label_patch = {"metadata": {"labels": {"aswarm/quarantine": "true"}}}
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                list(ex.map(
+                    lambda p: v1.patch_namespaced_pod(p.metadata.name, ns, label_patch),
+                    pods))
+            anom_pod = pods[0].metadata.name if pods else ""
+        else:
+            _kubectl_apply(ns, 'k8s/quarantine-template.yaml')
+            subprocess.check_call(['kubectl','-n',ns,'label','pods','-l',selector,'aswarm/quarantine=true','--overwrite'])
+
+            # find an anomaly pod
+            anom_pod = subprocess.check_output(
+                ['kubectl','-n',ns,'get','pods','-l',selector,'-o','jsonpath={.items[0].metadata.name}']
+            ).decode().strip()
+
         if not anom_pod:
             print(f"No pods found with selector {selector}", file=sys.stderr)
             sys.exit(3)
         
         # probe a noisy pod service until connections fail (denied by NetworkPolicy)
         print(f"Probing connectivity from {anom_pod}...", flush=True)
-        start_probe = time.perf_counter()
-        deadline = start_probe + 15.0  # 15s max
+        deadline_ns = NOW_NS() + 15_000_000_000  # 15s max
         contained_at = None
-        contained_at_perf = None
+        contained_at_ns = None
         probe_attempts = 0
-        
-        while time.perf_counter() < deadline:
-            probe_attempts += 1
-            # Try to connect to a service
-            rc = subprocess.call([
-                'kubectl','-n',ns,'exec',anom_pod,'--','/bin/sh','-c',
-                'timeout 1 nc -zv noisy.aswarm.svc.cluster.local 80 2>&1 || echo "BLOCKED"'
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            
-            # Also check if we can see "BLOCKED" in output
+
+        if net is not None:
+            # Prefer the CNI's own policy-programmed signal when published:
+            # some dataplanes flip an Accepted condition on the
+            # NetworkPolicy status as they realize it, which attributes t2
+            # to policy programming rather than TCP retry timing. Most
+            # CNIs never publish it, so fall back to the in-pod probe
+            # after a 2s grace window.
             try:
-                probe_out = subprocess.check_output([
+                w = watch.Watch()
+                for ev in w.stream(net.list_namespaced_network_policy, ns,
+                                   field_selector='metadata.name=aswarm-quarantine',
+                                   timeout_seconds=2):
+                    conds = getattr(ev['object'].status, 'conditions', None) or []
+                    if any(c.type == 'Accepted' and c.status == 'True' for c in conds):
+                        contained_at = datetime.now(timezone.utc)
+                        contained_at_ns = NOW_NS()
+                        print("Containment signaled by NetworkPolicy status condition", flush=True)
+                        w.stop()
+                        break
+            except Exception:
+                pass  # status subresource absent on this apiserver/CNI
+
+        if contained_at is None and v1 is not None:
+            # One long-lived exec runs an in-pod probe loop at 50ms cadence:
+            # a single SPDY upgrade for the whole window and ~1ms per tick.
+            # Probing must run inside the pod — a host port-forward cannot
+            # observe the quarantined pod's egress, and kubelet port-forward
+            # bypasses NetworkPolicy enforcement entirely.
+            probe_cmd = ('while true; do '
+                         'timeout 0.2 nc -zv noisy.aswarm.svc.cluster.local 80 >/dev/null 2>&1 '
+                         '&& echo OK || echo BLOCKED; sleep 0.05; done')
+            ws = k8s_stream(v1.connect_get_namespaced_pod_exec, anom_pod, ns,
+                            command=['/bin/sh', '-c', probe_cmd],
+                            stderr=True, stdout=True, stdin=False, tty=False,
+                            _preload_content=False)
+            try:
+                while NOW_NS() < deadline_ns and ws.is_open():
+                    out = ws.read_stdout(timeout=0.1)
+                    if not out:
+                        continue
+                    probe_attempts += out.count('\n')
+                    if 'BLOCKED' in out:
+                        contained_at = datetime.now(timezone.utc)
+                        contained_at_ns = NOW_NS()
+                        print(f"Containment verified after {probe_attempts} probes", flush=True)
+                        break
+            finally:
+                ws.close()
+        elif contained_at is None:
+            # AIMD cadence: front-load probes right after the policy apply
+            # (fast NetworkPolicy propagation is caught within tens of ms)
+            # and back off multiplicatively toward 250ms while the
+            # connection stays open, keeping total apiserver QPS bounded
+            interval = 0.025
+            tick = _Ticker(interval)
+            while NOW_NS() < deadline_ns:
+                probe_attempts += 1
+                # Single exec per iteration: capture return code and output
+                # in one apiserver round trip instead of two
+                res = subprocess.run([
                     'kubectl','-n',ns,'exec',anom_pod,'--','/bin/sh','-c',
                     'timeout 1 nc -zv noisy.aswarm.svc.cluster.local 80 2>&1 || echo "BLOCKED"'
-                ]).decode()
-                if "BLOCKED" in probe_out or "Connection refused" in probe_out or rc != 0:
+                ], capture_output=True, text=True, timeout=2, check=False)
+                if res.returncode != 0 or "BLOCKED" in res.stdout or "Connection refused" in res.stdout:
                     contained_at = datetime.now(timezone.utc)
-                    contained_at_perf = time.perf_counter()
+                    contained_at_ns = NOW_NS()
                     print(f"Containment verified after {probe_attempts} probes", flush=True)
                     break
-            except subprocess.CalledProcessError:
-                # Connection blocked by NetworkPolicy
-                contained_at = datetime.now(timezone.utc)
-                contained_at_perf = time.perf_counter()
-                print(f"Containment verified after {probe_attempts} probes", flush=True)
-                break
-            
-            time.sleep(0.25)
-        
+
+                interval = min(0.25, interval * 1.5)
+                tick.rearm(interval)
+                tick.wait()
+            tick.close()
+
         if not contained_at:
             print("Containment not observed within 15s window.", file=sys.stderr)
             sys.exit(3)
         
         t2 = contained_at
-        t2_perf = contained_at_perf
-        
+        t2_ns = contained_at_ns
+
         # Calculate metrics using monotonic clock
-        mttd_perf = (t1_perf - t0_perf) * 1000.0  # milliseconds
-        mttr_perf = t2_perf - t1_perf  # seconds
+        mttd_perf = (t1_ns - t0_ns) / 1e6  # milliseconds
+        mttr_perf = (t2_ns - t1_ns) / 1e9  # seconds
         
         # For display, also calculate from wall clock
         mttd_wall = (t1 - t0).total_seconds() * 1000.0
@@ -174,21 +476,30 @@ def main(ns, selector="app=anomaly", repeat=1):
         clock_source = "UTC+NTP"  # In production, detect actual source
         
         # Get policy hash
-        policy_yaml = subprocess.check_output(
-            ['kubectl','-n',ns,'get','networkpolicy/aswarm-quarantine','-o','yaml']
-        )
-        policy_hash = hashlib.sha256(policy_yaml).hexdigest()
+        if net is not None:
+            policy = net.read_namespaced_network_policy('aswarm-quarantine', ns)
+            policy_doc = client.ApiClient().sanitize_for_serialization(policy)
+            policy_hash = hashlib.sha256(json.dumps(policy_doc, sort_keys=True).encode()).hexdigest()
+        else:
+            policy_yaml = subprocess.check_output(
+                ['kubectl','-n',ns,'get','networkpolicy/aswarm-quarantine','-o','yaml']
+            )
+            policy_hash = hashlib.sha256(policy_yaml).hexdigest()
         
         # Launch auto-revert job for safety
         print("Launching TTL auto-revert job...", flush=True)
         try:
-            # Delete any existing revert job first
-            subprocess.call(['kubectl','-n',ns,'delete','job','quarantine-revert'], 
-                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            # Create new revert job
-            subprocess.check_call(['kubectl','apply','-f','k8s/quarantine-revert-job.yaml'])
+            if batch is not None:
+                _create_job(batch, ns,
+                            yaml.safe_load(Path('k8s/quarantine-revert-job.yaml').read_text()))
+            else:
+                # Delete any existing revert job first
+                subprocess.call(['kubectl','-n',ns,'delete','job','quarantine-revert'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                # Create new revert job
+                _kubectl_apply(ns, 'k8s/quarantine-revert-job.yaml')
             revert_scheduled_at = datetime.now(timezone.utc).isoformat()
-        except subprocess.CalledProcessError as e:
+        except Exception as e:
             print(f"Warning: Could not launch auto-revert job: {e}", file=sys.stderr)
             revert_scheduled_at = None
         
@@ -219,8 +530,9 @@ def main(ns, selector="app=anomaly", repeat=1):
             "outcome": {
                 "status": "contained",
                 "probe_attempts": probe_attempts,
-                "containment_delay_ms": round((t2_perf - apply_t_perf) * 1000, 1),
-                "notes": "connectivity blocked via NetworkPolicy probe"
+                "containment_delay_ms": round((t2_ns - apply_t_ns) / 1e6, 1),
+                "notes": ("connectivity blocked via NetworkPolicy probe"
+                          + (" (in-pod exec stream, 50ms cadence)" if v1 is not None else ""))
             },
             "metrics": {
                 "MTTD_ms_monotonic": round(mttd_perf, 1),
@@ -234,15 +546,21 @@ def main(ns, selector="app=anomaly", repeat=1):
             }
         }
         
-        # Save certificate
+        # Save certificate atomically: write to a temp name and rename so
+        # an interrupted run never leaves a half-written certificate.
+        # Durability (fsync) is settled once per batch at the end of main.
         out_dir = Path("ActionCertificates")
         out_dir.mkdir(exist_ok=True)
         cert_path = out_dir / f"{run_id}.json"
-        cert_path.write_text(json.dumps(artifact, indent=2))
-        
-        # Demo signature (replace with HSM later)
+        cert_bytes = json.dumps(artifact, indent=2).encode()
+        tmp_path = cert_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(cert_bytes)
+        os.replace(tmp_path, cert_path)
+
+        # Demo signature (replace with HSM later): sign the in-memory bytes
+        # instead of reading the file back from disk
         key = os.environ.get("ACTION_CERT_DEMO_KEY", "aswarm-demo-key").encode()
-        sig = hmac.new(key, cert_path.read_bytes(), hashlib.sha256).hexdigest()
+        sig = hmac.new(key, cert_bytes, hashlib.sha256).hexdigest()
         
         # Run result
         run_result = {
@@ -261,37 +579,82 @@ def main(ns, selector="app=anomaly", repeat=1):
             "mttr": mttr_perf
         })
         
-        # Clean up for next run
+        # Clean up for next run: one kubectl invocation covers both
+        # resources, and --ignore-not-found lets the apiserver short-circuit
+        # instead of returning an error to swallow
         if run_num < repeat - 1:
-            subprocess.call(['kubectl','-n',ns,'delete','job','anomaly-scan'], 
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            subprocess.call(['kubectl','-n',ns,'delete','cm','aswarm-elevated'], 
+            subprocess.call(['kubectl','-n',ns,'delete','job/anomaly-scan',
+                             'cm/aswarm-elevated','--ignore-not-found'],
                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            time.sleep(2)
+            if v1 is not None:
+                # Event-driven settle: wake on the DELETED events for the
+                # old job's pods instead of sleeping a fixed 2s per run
+                pods = v1.list_namespaced_pod(
+                    ns, label_selector='job-name=anomaly-scan')
+                remaining = {p.metadata.name for p in pods.items}
+                if remaining:
+                    w = watch.Watch()
+                    for ev in w.stream(
+                            v1.list_namespaced_pod, ns,
+                            label_selector='job-name=anomaly-scan',
+                            resource_version=pods.metadata.resource_version,
+                            timeout_seconds=10):
+                        if ev['type'] == 'DELETED':
+                            remaining.discard(ev['object'].metadata.name)
+                            if not remaining:
+                                w.stop()
+                                break
+            else:
+                time.sleep(2)
     
+    if informer is not None:
+        informer.stop()
+
+    # One directory-level fsync persists every rename of the batch,
+    # instead of paying a synchronous flush per certificate
+    if all_runs:
+        dirfd = os.open("ActionCertificates", os.O_DIRECTORY)
+        try:
+            os.fsync(dirfd)
+        finally:
+            os.close(dirfd)
+
     # If multiple runs, calculate percentiles
     if repeat > 1:
-        mttds = sorted([r["mttd"] for r in all_runs])
-        mttrs = sorted([r["mttr"] for r in all_runs])
-        
-        def percentile(data, p):
-            n = len(data)
-            i = int(n * p / 100)
-            return data[min(i, n-1)]
-        
+        mttds = [r["mttd"] for r in all_runs]
+        mttrs = [r["mttr"] for r in all_runs]
+
+        if np is not None:
+            # Linear interpolation matches Prometheus/Grafana reporting and
+            # uses an O(n) vectorized partition instead of a full sort
+            def pcts(data):
+                q = np.quantile(np.asarray(data, dtype=np.float64),
+                                [0.5, 0.95, 0.99], method='linear')
+                return float(q[0]), float(q[1]), float(q[2])
+        else:
+            def pcts(data):
+                data = sorted(data)
+                n = len(data)
+                def nearest(p):
+                    return data[min(int(n * p / 100), n - 1)]
+                return nearest(50), nearest(95), nearest(99)
+
+        d50, d95, d99 = pcts(mttds)
+        r50, r95, r99 = pcts(mttrs)
+
         summary = {
             "total_runs": repeat,
             "MTTD_ms": {
-                "p50": round(percentile(mttds, 50), 1),
-                "p95": round(percentile(mttds, 95), 1),
-                "p99": round(percentile(mttds, 99), 1),
+                "p50": round(d50, 1),
+                "p95": round(d95, 1),
+                "p99": round(d99, 1),
                 "min": round(min(mttds), 1),
                 "max": round(max(mttds), 1)
             },
             "MTTR_s": {
-                "p50": round(percentile(mttrs, 50), 2),
-                "p95": round(percentile(mttrs, 95), 2),
-                "p99": round(percentile(mttrs, 99), 2),
+                "p50": round(r50, 2),
+                "p95": round(r95, 2),
+                "p99": round(r99, 2),
                 "min": round(min(mttrs), 2),
                 "max": round(max(mttrs), 2)
             }
@@ -321,5 +684,10 @@ if __name__ == "__main__":
     ap.add_argument("--namespace", default="aswarm")
     ap.add_argument("--selector", default="app=anomaly", help="Pod selector for quarantine")
     ap.add_argument("--repeat", type=int, default=1, help="Number of runs for percentile metrics")
+    ap.add_argument("--legacy", action="store_true",
+                    help="Poll with kubectl instead of the Kubernetes client watch")
+    ap.add_argument("--run-id-prefix", default="",
+                    help="Human-readable prefix for generated run IDs")
     args = ap.parse_args()
-    main(args.namespace, args.selector, args.repeat)
\ No newline at end of file
+    main(args.namespace, args.selector, args.repeat, args.legacy,
+         args.run_id_prefix)
\ No newline at end of file
@@ -2,87 +2,94 @@
 """
 Simple test to verify individual components work before integration
 """
+import io
 import os
 import sys
 import subprocess
 import time
+from contextlib import redirect_stdout
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# In-process by default: importing the modules and calling main() skips
+# interpreter+import startup per test and lets tracebacks surface
+# directly. --subprocess restores the old isolated-interpreter variant.
+USE_SUBPROCESS = False
+
+def run_standalone(name, module_name, argv, timeout):
+    """Run a component's main(argv) in-process, or via subprocess with --subprocess"""
+    if USE_SUBPROCESS:
+        cmd = [sys.executable, "-m", module_name] + argv
+        try:
+            result = subprocess.run(
+                cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=timeout
+            )
+
+            print(f"Return code: {result.returncode}")
+            print(f"Stdout: {result.stdout}")
+            if result.stderr:
+                print(f"Stderr: {result.stderr}")
+
+            if result.returncode == 0:
+                print(f"✅ {name} standalone OK")
+                return True
+            else:
+                print(f"❌ {name} failed with code {result.returncode}")
+                return False
+
+        except subprocess.TimeoutExpired:
+            print(f"❌ {name} timed out")
+            return False
+        except Exception as e:
+            print(f"❌ {name} test error: {e}")
+            return False
+
+    buf = io.StringIO()
+    try:
+        import importlib
+        module = importlib.import_module(module_name)
+        with redirect_stdout(buf):
+            rc = module.main(argv) or 0
+    except SystemExit as e:
+        rc = e.code or 0
+    except Exception as e:
+        print(f"Stdout: {buf.getvalue()}")
+        print(f"❌ {name} test error: {e}")
+        return False
+
+    print(f"Return code: {rc}")
+    print(f"Stdout: {buf.getvalue()}")
+    if rc == 0:
+        print(f"✅ {name} standalone OK")
+        return True
+    print(f"❌ {name} failed with code {rc}")
+    return False
 
 def test_sentinel_standalone():
     """Test Sentinel v2 can run standalone"""
     print("=== Testing Sentinel v2 Standalone ===")
-    
-    cmd = [
-        sys.executable, "-m", "sentinel.telemetry_v2",
+
+    return run_standalone("Sentinel", "sentinel.telemetry_v2", [
         "--namespace=aswarm",
-        "--cadence-ms=500", 
+        "--cadence-ms=500",
         "--duration=5",
         "--run-id=test-sentinel",
         "--trigger-anomaly=3"
-    ]
-    
-    try:
-        result = subprocess.run(
-            cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=10
-        )
-        
-        print(f"Return code: {result.returncode}")
-        print(f"Stdout: {result.stdout}")
-        if result.stderr:
-            print(f"Stderr: {result.stderr}")
-            
-        if result.returncode == 0:
-            print("✅ Sentinel standalone OK")
-            return True
-        else:
-            print(f"❌ Sentinel failed with code {result.returncode}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("❌ Sentinel timed out")
-        return False
-    except Exception as e:
-        print(f"❌ Sentinel test error: {e}")
-        return False
+    ], timeout=10)
 
 def test_pheromone_standalone():
     """Test Pheromone v2 can run standalone"""
     print("\n=== Testing Pheromone v2 Standalone ===")
-    
-    cmd = [
-        sys.executable, "-m", "pheromone.gossip_v2",
+
+    return run_standalone("Pheromone", "pheromone.gossip_v2", [
         "--namespace=aswarm",
         "--duration=3",
         "--run-id=test-pheromone",
         "--window-ms=500",
         "--quorum=1"
-    ]
-    
-    try:
-        result = subprocess.run(
-            cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=8
-        )
-        
-        print(f"Return code: {result.returncode}")
-        print(f"Stdout: {result.stdout}")
-        if result.stderr:
-            print(f"Stderr: {result.stderr}")
-            
-        if result.returncode == 0:
-            print("✅ Pheromone standalone OK")
-            return True
-        else:
-            print(f"❌ Pheromone failed with code {result.returncode}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("❌ Pheromone timed out")
-        return False
-    except Exception as e:
-        print(f"❌ Pheromone test error: {e}")
-        return False
+    ], timeout=8)
 
 def check_namespace():
     """Check if aswarm namespace exists"""
@@ -137,5 +144,7 @@ def main():
     return passed == len(tests)
 
 if __name__ == "__main__":
+    if "--subprocess" in sys.argv[1:]:
+        USE_SUBPROCESS = True
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -2,89 +2,321 @@
 """
 Validate that evidence pack metrics meet SLO targets
 Used in CI to gate releases
+
+Fully annotated so CI images can AOT-compile it with
+`mypyc scripts/validate_slo.py`; the interpreter falls back to this
+source when no compiled extension is present.
 """
-import json
+import functools
+import hashlib
+import mmap
+import os
+import pickle
 import sys
 import zipfile
+from operator import itemgetter
 from pathlib import Path
 
-def validate_evidence_pack(zip_path: str, mttd_threshold: float = 2000, mttr_threshold: float = 1500):
+try:
+    # Intel ISA-L inflate is ~1.5-2x faster than CPython's zlib and is
+    # API-compatible (decompressobj, crc32), so zipfile can use it as a
+    # drop-in for DEFLATE members.
+    from isal import isal_zlib as _isal_zlib
+    zipfile.zlib = _isal_zlib
+except ImportError:
+    pass
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    import orjson as _json  # parses bytes directly; no utf-8 decode pass
+except ImportError:
+    import json as _json
+
+try:
+    import simdjson
+    # Module-level parser so its tape buffer is reused across calls
+    _parser = simdjson.Parser()
+except ImportError:
+    _parser = None
+
+_METRIC_SCHEMA = {
+    'type': 'object',
+    'required': ['p95_ms', 'success_rate'],
+    'properties': {
+        'p95_ms': {'type': 'number'},
+        'success_rate': {'type': 'number'},
+    },
+}
+_EVIDENCE_SCHEMA = {
+    'type': 'object',
+    'required': ['metrics'],
+    'properties': {
+        'metrics': {
+            'type': 'object',
+            'required': ['mttd', 'mttr'],
+            'properties': {'mttd': _METRIC_SCHEMA, 'mttr': _METRIC_SCHEMA},
+        },
+    },
+}
+
+try:
+    # Rust-backed validator (PyO3); structural checks run at native speed
+    import jsonschema_rs
+    _validate_shape = jsonschema_rs.JSONSchema(_EVIDENCE_SCHEMA).validate
+except ImportError:
+    try:
+        import fastjsonschema
+        # Compiled once at import; emits specialized pure-Python checks with
+        # explicit error messages instead of bare KeyErrors on malformed packs.
+        _validate_shape = fastjsonschema.compile(_EVIDENCE_SCHEMA)
+    except ImportError:
+        _validate_shape = None
+
+# C-level multi-key fetchers; one call per dict instead of chained subscripts
+_GET_RUNGS = itemgetter('mttd', 'mttr')
+_GET_FIELDS = itemgetter('p95_ms', 'success_rate')
+
+# On-disk cache so repeated CI invocations against the same pack skip
+# both inflate and parse. Keyed on size + mtime_ns + first-64KB hash; any
+# stat mismatch is a conservative miss.
+_CACHE_DIR = Path.home() / '.cache' / 'aswarm' / 'slo'
+
+def _extract_metrics(zf: zipfile.ZipFile) -> tuple[float, float, float, float]:
+    """Extract (mttd_p95, mttr_p95, mttd_success, mttr_success) from an open pack"""
+    # Stream evidence.json out of the archive rather than
+    # zf.read()-ing the whole member up front.
+    with zf.open('evidence.json') as f:
+        # Extract the four gated scalars. simdjson's lazy documents
+        # read them without materializing the full evidence tree;
+        # otherwise fall back to a normal parse (stdlib json can
+        # consume the file object directly, orjson cannot).
+        if _parser is not None:
+            # JSON pointers index the tape directly; no intermediate
+            # dicts are built for the path segments.
+            doc = _parser.parse(f.read())
+            return (float(doc.at_pointer('/metrics/mttd/p95_ms')),
+                    float(doc.at_pointer('/metrics/mttr/p95_ms')),
+                    float(doc.at_pointer('/metrics/mttd/success_rate')),
+                    float(doc.at_pointer('/metrics/mttr/success_rate')))
+        if hasattr(_json, 'load'):
+            evidence_data = _json.load(f)
+        else:
+            evidence_data = _json.loads(f.read())
+        if _validate_shape is not None:
+            _validate_shape(evidence_data)
+        mttd, mttr = _GET_RUNGS(evidence_data['metrics'])
+        mttd_p95, mttd_success = _GET_FIELDS(mttd)
+        mttr_p95, mttr_success = _GET_FIELDS(mttr)
+        return (mttd_p95, mttr_p95, mttd_success, mttr_success)
+
+def _parse_evidence(zip_path: str) -> tuple[float, float, float, float]:
+    """One-shot metric extraction from a pack on disk"""
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        return _extract_metrics(zf)
+
+class _MmapStream:
+    """Minimal seekable file-like over an mmap (zipfile needs seekable())"""
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    def read(self, n=None):
+        return self._mm.read(n)
+
+    def seek(self, pos, whence=0):
+        self._mm.seek(pos, whence)
+        return self._mm.tell()
+
+    def tell(self):
+        return self._mm.tell()
+
+    def seekable(self):
+        return True
+
+class EvidencePackReader:
+    """Holds one evidence pack open for repeated metric reads.
+
+    For matrix fan-in jobs that validate the same pack many times in one
+    process: the archive is mmap'd (OS page cache backs every access, no
+    user-space copy of the file) and the central directory is scanned
+    once, so each get_metrics() after the first skips open/inflate/parse.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            self._mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self._zf = zipfile.ZipFile(_MmapStream(self._mm))
+        self._metrics = None
+
+    def get_metrics(self) -> tuple[float, float, float, float]:
+        if self._metrics is None:
+            self._metrics = _extract_metrics(self._zf)
+        return self._metrics
+
+    def close(self):
+        self._zf.close()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+@functools.lru_cache(maxsize=32)
+def _load_evidence(zip_path: str, mtime_ns: int, size: int) -> tuple[float, float, float, float]:
+    """Cached metric extraction; mtime_ns/size are part of the cache key"""
+    sig = hashlib.sha256()
+    with open(zip_path, 'rb') as f:
+        sig.update(f.read(65536))
+    sig.update(f'{size}:{mtime_ns}'.encode())
+    cache_file = _CACHE_DIR / f'{sig.hexdigest()}.pkl'
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    metrics = _parse_evidence(zip_path)
+
+    # Best-effort persist; an unwritable cache dir must not fail the gate
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump(metrics, f)
+        tmp.replace(cache_file)
+    except OSError:
+        pass
+    return metrics
+
+def validate_evidence_pack(zip_path: str, mttd_threshold: float = 2000, mttr_threshold: float = 1500) -> bool:
     """Validate evidence pack meets SLO thresholds"""
-    print(f"Validating evidence pack: {zip_path}")
-    
-    if not Path(zip_path).exists():
-        print(f"ERROR: Evidence pack not found: {zip_path}")
-        return False
-    
+    # Accumulate the report and emit it as one write: a single stdout
+    # lock/encode instead of ~10 line-buffered flushes per pack.
+    out = [f"Validating evidence pack: {zip_path}"]
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            # Read evidence.json
-            evidence_data = json.loads(zf.read('evidence.json').decode())
-            
-            # Extract metrics
-            mttd_p95 = evidence_data['metrics']['mttd']['p95_ms']
-            mttr_p95 = evidence_data['metrics']['mttr']['p95_ms']
-            mttd_success = evidence_data['metrics']['mttd']['success_rate']
-            mttr_success = evidence_data['metrics']['mttr']['success_rate']
-            
-            print(f"\nMetrics Summary:")
-            print(f"  P95 MTTD: {mttd_p95:.0f}ms (threshold: {mttd_threshold}ms)")
-            print(f"  P95 MTTR: {mttr_p95:.0f}ms (threshold: {mttr_threshold}ms)")
-            print(f"  MTTD Success Rate: {mttd_success:.0f}%")
-            print(f"  MTTR Success Rate: {mttr_success:.0f}%")
-            
-            # Validate against thresholds
-            passed = True
-            failures = []
-            
-            if mttd_p95 > mttd_threshold:
-                failures.append(f"P95 MTTD ({mttd_p95:.0f}ms) exceeds threshold ({mttd_threshold}ms)")
-                passed = False
-                
-            if mttr_p95 > mttr_threshold:
-                failures.append(f"P95 MTTR ({mttr_p95:.0f}ms) exceeds threshold ({mttr_threshold}ms)")
-                passed = False
-                
-            if mttd_success < 90:
-                failures.append(f"MTTD success rate ({mttd_success:.0f}%) below 90%")
-                passed = False
-                
-            if mttr_success < 90:
-                failures.append(f"MTTR success rate ({mttr_success:.0f}%) below 90%")
-                passed = False
-            
+        if not Path(zip_path).exists():
+            out.append(f"ERROR: Evidence pack not found: {zip_path}")
+            return False
+
+        try:
+            st = os.stat(zip_path)
+            mttd_p95, mttr_p95, mttd_success, mttr_success = _load_evidence(
+                zip_path, st.st_mtime_ns, st.st_size)
+
+            out.append(f"\nMetrics Summary:")
+            out.append(f"  P95 MTTD: {mttd_p95:.0f}ms (threshold: {mttd_threshold}ms)")
+            out.append(f"  P95 MTTR: {mttr_p95:.0f}ms (threshold: {mttr_threshold}ms)")
+            out.append(f"  MTTD Success Rate: {mttd_success:.0f}%")
+            out.append(f"  MTTR Success Rate: {mttr_success:.0f}%")
+
+            # Validate against thresholds. Failure messages are indexed by
+            # gate so the compare itself stays a flat array operation that
+            # scales as more SLOs are added.
+            msgs = (
+                f"P95 MTTD ({mttd_p95:.0f}ms) exceeds threshold ({mttd_threshold}ms)",
+                f"P95 MTTR ({mttr_p95:.0f}ms) exceeds threshold ({mttr_threshold}ms)",
+                f"MTTD success rate ({mttd_success:.0f}%) below 90%",
+                f"MTTR success rate ({mttr_success:.0f}%) below 90%",
+            )
+            if _np is not None:
+                # Negating the success terms turns the >=90 gates into the
+                # same 'value exceeds bound' form, so one vectorized
+                # compare covers all of them
+                vals = _np.array([mttd_p95, mttr_p95, -mttd_success, -mttr_success],
+                                 dtype=_np.float64)
+                bounds = _np.array([mttd_threshold, mttr_threshold, -90.0, -90.0],
+                                   dtype=_np.float64)
+                failed = (vals > bounds).nonzero()[0]
+            else:
+                gates = (mttd_p95 > mttd_threshold, mttr_p95 > mttr_threshold,
+                         mttd_success < 90, mttr_success < 90)
+                failed = [i for i, hit in enumerate(gates) if hit]
+
+            failures = [msgs[i] for i in failed]
+            passed = not failures
+
             # Report results
             if passed:
-                print("\n✅ PASS: All SLOs met")
+                out.append("\n✅ PASS: All SLOs met")
                 return True
             else:
-                print("\n❌ FAIL: SLO violations detected:")
+                out.append("\n❌ FAIL: SLO violations detected:")
                 for failure in failures:
-                    print(f"  - {failure}")
+                    out.append(f"  - {failure}")
                 return False
-                
-    except Exception as e:
-        print(f"ERROR: Failed to validate evidence pack: {e}")
-        return False
-
-def main():
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Validate evidence pack SLOs")
-    parser.add_argument("evidence_pack", help="Path to evidence pack ZIP")
-    parser.add_argument("--mttd-threshold", type=float, default=2000,
-                      help="P95 MTTD threshold in ms (default: 2000)")
-    parser.add_argument("--mttr-threshold", type=float, default=1500,
-                      help="P95 MTTR threshold in ms (default: 1500)")
-    
-    args = parser.parse_args()
-    
+
+        except Exception as e:
+            out.append(f"ERROR: Failed to validate evidence pack: {e}")
+            return False
+    finally:
+        sys.stdout.write('\n'.join(out) + '\n')
+
+_USAGE = """usage: validate_slo.py [-h] [--mttd-threshold MS] [--mttr-threshold MS] evidence_pack
+
+Validate evidence pack SLOs
+
+positional arguments:
+  evidence_pack        Path to evidence pack ZIP
+
+options:
+  -h, --help           show this help message and exit
+  --mttd-threshold MS  P95 MTTD threshold in ms (default: 2000)
+  --mttr-threshold MS  P95 MTTR threshold in ms (default: 1500)"""
+
+def main() -> None:
+    # Hand-rolled argv walk: argparse construction costs tens of ms of
+    # cold start, which dominates for a CI gate run thousands of times.
+    evidence_pack = None
+    mttd_threshold = 2000.0
+    mttr_threshold = 1500.0
+
+    argv = sys.argv[1:]
+    i = 0
+    try:
+        while i < len(argv):
+            arg = argv[i]
+            if arg in ('-h', '--help'):
+                print(_USAGE)
+                sys.exit(0)
+            elif arg == '--mttd-threshold':
+                i += 1
+                mttd_threshold = float(argv[i])
+            elif arg.startswith('--mttd-threshold='):
+                mttd_threshold = float(arg.split('=', 1)[1])
+            elif arg == '--mttr-threshold':
+                i += 1
+                mttr_threshold = float(argv[i])
+            elif arg.startswith('--mttr-threshold='):
+                mttr_threshold = float(arg.split('=', 1)[1])
+            elif arg.startswith('-') or evidence_pack is not None:
+                raise ValueError(f"unrecognized argument: {arg}")
+            else:
+                evidence_pack = arg
+            i += 1
+        if evidence_pack is None:
+            raise ValueError("the following arguments are required: evidence_pack")
+    except (IndexError, ValueError) as e:
+        print(_USAGE, file=sys.stderr)
+        print(f"validate_slo.py: error: {e}", file=sys.stderr)
+        sys.exit(2)
+
     success = validate_evidence_pack(
-        args.evidence_pack,
-        mttd_threshold=args.mttd_threshold,
-        mttr_threshold=args.mttr_threshold
+        evidence_pack,
+        mttd_threshold=mttd_threshold,
+        mttr_threshold=mttr_threshold
     )
-    
+
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ import json
 import random
 import hashlib
 import logging
+import threading
 from datetime import datetime, timezone
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
@@ -64,11 +65,20 @@ class DualPathTelemetry:
         sanitized_node = sanitized_node.strip('-')  # Remove leading/trailing dashes
         
         self.lease_name = f"aswarm-sentinel-{sanitized_node}"
+        self._lease_exists = False  # set once create/patch succeeds; skips 404->create races
         
         # Signal state
         self.sequence = 0
         self.anomaly_signals = 0
         self.last_reset = time.time()
+
+        # Stop signal: lets duration expiry or an external caller wake the
+        # loop mid-sleep instead of waiting out the cadence
+        self._stop = threading.Event()
+
+        # Precomputed jitter ring (-10ms to +20ms): indexed by sequence so the
+        # hot loop avoids a per-tick RNG call and jitter is replayable per seed
+        self._jitter = [random.uniform(-0.01, 0.02) for _ in range(1024)]
         
         # Initialize UDP fast-path if enabled
         self.fastpath_sender = None
@@ -201,43 +211,102 @@ class DualPathTelemetry:
             }
         }
 
-        # Try patch, create on 404, retry on conflict
+        # Try patch, create on 404, retry transients with jittered backoff
         for attempt in range(3):
-            try:
-                self.coordination_v1.patch_namespaced_lease(
-                    name=self.lease_name,
-                    namespace=self.namespace,
-                    body=patch
-                )
+            ok, needs_create, transient = self._patch_with_classify(patch)
+            if ok:
                 return now, elevate
-            except ApiException as e:
-                if e.status == 404:
-                    body = client.V1Lease(
-                        metadata=client.V1ObjectMeta(
-                            name=self.lease_name, 
-                            namespace=self.namespace,
-                            labels=labels
-                        ),
-                        spec=client.V1LeaseSpec(
-                            holder_identity=f"sentinel-{self.node_name}",
-                            lease_duration_seconds=5,
-                        ),
-                    )
-                    try:
-                        self.coordination_v1.create_namespaced_lease(self.namespace, body)
-                        # loop will patch next iteration
-                    except ApiException as ce:
-                        if ce.status not in (409,):
-                            print(f"Create lease error: {ce}", flush=True)
-                            break
-                elif e.status in (409, 429, 500):
-                    time.sleep(0.01 * (attempt + 1))  # tiny backoff
-                    continue
-                else:
-                    print(f"Lease patch error: {e}", flush=True)
-                    break
+            if needs_create:
+                self._ensure_lease_exists(labels)
+                continue  # patch again next attempt
+            if transient:
+                # Decorrelated jitter capped at half a cadence interval so a
+                # loaded apiserver doesn't eat the whole signal budget
+                time.sleep(random.uniform(0, min(self.cadence_s / 2, 2 ** attempt * 0.005)))
+                continue
+            break  # non-retryable
         return now, elevate
+
+    def _patch_with_classify(self, patch) -> tuple[bool, bool, bool]:
+        """Single Lease patch attempt, classified as (ok, needs_create, transient)."""
+        try:
+            self.coordination_v1.patch_namespaced_lease(
+                name=self.lease_name,
+                namespace=self.namespace,
+                body=patch
+            )
+            self._lease_exists = True
+            return True, False, False
+        except ApiException as e:
+            if e.status == 404:
+                self._lease_exists = False
+                return False, True, False
+            if e.status in (409, 429, 500):
+                return False, False, True
+            print(f"Lease patch error: {e}", flush=True)
+            return False, False, False
+
+    def _ensure_lease_exists(self, labels):
+        """Create the Lease if we haven't already seen it; 409 means we lost the race."""
+        if self._lease_exists:
+            return
+        body = client.V1Lease(
+            metadata=client.V1ObjectMeta(
+                name=self.lease_name,
+                namespace=self.namespace,
+                labels=labels
+            ),
+            spec=client.V1LeaseSpec(
+                holder_identity=f"sentinel-{self.node_name}",
+                lease_duration_seconds=5,
+            ),
+        )
+        try:
+            self.coordination_v1.create_namespaced_lease(self.namespace, body)
+            self._lease_exists = True
+        except ApiException as ce:
+            if ce.status == 409:
+                self._lease_exists = True  # someone else created it
+            else:
+                print(f"Create lease error: {ce}", flush=True)
     
+    def stop(self):
+        """Request the telemetry loop to exit; wakes any in-progress sleep."""
+        self._stop.set()
+
+    def start_control_socket(self, path):
+        """Accept anomaly triggers on a Unix datagram socket.
+
+        A harness can keep one long-lived Sentinel and flip it into
+        anomaly mode with a single sendto, so measured MTTD excludes
+        interpreter + kube-client startup. Message format:
+        b"ANOMALY [run_id] [signal_count]".
+        """
+        import socket
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(path)
+        self._control_sock = sock
+
+        def _serve():
+            while not self._stop.is_set():
+                try:
+                    msg = sock.recv(256)
+                except OSError:
+                    return
+                parts = msg.decode(errors='replace').split()
+                if parts and parts[0] == 'ANOMALY':
+                    if len(parts) > 1:
+                        self._run_id = parts[1]
+                    count = int(parts[2]) if len(parts) > 2 else 10
+                    self.trigger_anomaly_simulation(count)
+
+        threading.Thread(target=_serve, daemon=True).start()
+        logger.info(f"Control socket listening: {path}")
+
     def run_telemetry_loop(self, duration_s=None, run_id=None):
         """Run main telemetry loop with jittered cadence and hysteresis
         
@@ -246,9 +315,13 @@ class DualPathTelemetry:
             run_id: Optional run identifier for scoping
         """
         start = time.perf_counter()
+        # run_id lives on self so a control-socket message can retarget a
+        # long-lived Sentinel between trials
+        self._run_id = run_id
         print(f"Starting telemetry loop: {self.cadence_s*1000:.0f}ms cadence, run_id={run_id}", flush=True)
-        
-        while True:
+
+        while not self._stop.is_set():
+            run_id = self._run_id
             loop_start = time.perf_counter()
             sketch = self.generate_packet_sketch()
             graph = self.generate_process_graph()
@@ -299,9 +372,10 @@ class DualPathTelemetry:
 
             # jittered cadence to avoid lease write herds
             elapsed = time.perf_counter() - loop_start
-            jitter = random.uniform(-0.01, 0.02)  # -10ms to +20ms jitter
+            jitter = self._jitter[self.sequence & 1023]
             sleep_time = max(0, (self.cadence_s + jitter) - elapsed)
-            time.sleep(sleep_time)
+            if self._stop.wait(sleep_time):
+                break
         
         logger.info(f"Telemetry loop completed: {self.sequence} signals")
         
@@ -309,7 +383,76 @@ class DualPathTelemetry:
         if self.fastpath_sender:
             self.fastpath_sender.close()
 
-def main():
+def _resolve_fastpath_host(host: str, timeout_s: float = 0.5) -> bool:
+    """Resolve host with a bounded timeout and a short on-disk TTL cache.
+
+    A cold cluster-DNS lookup can block for seconds on misconfigured
+    clusters; cap it so telemetry startup stays bounded. Successful
+    resolutions are cached for 60s to skip the lookup on restart.
+    """
+    import socket
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache_path = os.path.join(os.path.expanduser("~"), ".cache", "aswarm", "dns.json")
+    now = time.time()
+    cache = {}
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+        if now - cache.get(host, 0) < 60:
+            return True
+    except (OSError, ValueError):
+        pass
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        pool.submit(socket.gethostbyname, host).result(timeout=timeout_s)
+    except Exception:
+        return False
+    finally:
+        pool.shutdown(wait=False)
+
+    cache[host] = now
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+    return True
+
+def run_inproc(args, stop_event=None):
+    """Run a Sentinel on the calling thread for in-process harnesses.
+
+    args mirrors the CLI namespace (namespace, cadence_ms, fastpath_host,
+    fastpath_port, no_fastpath, trigger_anomaly, control_socket,
+    duration, run_id). Setting stop_event ends the loop. The subprocess
+    CLI stays the production path.
+    """
+    sentinel = DualPathTelemetry(
+        namespace=args.namespace,
+        cadence_ms=args.cadence_ms,
+        fastpath_host=getattr(args, 'fastpath_host', None),
+        fastpath_port=getattr(args, 'fastpath_port', 8888),
+        fastpath_enabled=not getattr(args, 'no_fastpath', False)
+    )
+
+    if getattr(args, 'trigger_anomaly', None):
+        sentinel.trigger_anomaly_simulation(args.trigger_anomaly)
+
+    if getattr(args, 'control_socket', None):
+        sentinel.start_control_socket(args.control_socket)
+
+    if stop_event is not None:
+        def _watch_stop():
+            stop_event.wait()
+            sentinel.stop()
+        threading.Thread(target=_watch_stop, daemon=True).start()
+
+    sentinel.run_telemetry_loop(duration_s=args.duration, run_id=args.run_id)
+    return sentinel
+
+def main(argv=None):
     """CLI entry point for Sentinel telemetry"""
     import argparse
     
@@ -322,19 +465,19 @@ def main():
     parser.add_argument("--fastpath-host", help="UDP fast-path target host")
     parser.add_argument("--fastpath-port", type=int, default=8888, help="UDP fast-path port")
     parser.add_argument("--no-fastpath", action="store_true", help="Disable UDP fast-path")
-    
-    args = parser.parse_args()
+    parser.add_argument("--control-socket", help="Unix socket path for external anomaly triggers")
+
+    args = parser.parse_args(argv)
     
     # Auto-detect Pheromone service if not specified
     fastpath_host = args.fastpath_host
     if not fastpath_host and not args.no_fastpath:
-        try:
-            # Try to resolve Pheromone service
-            import socket
-            fastpath_host = f"aswarm-pheromone.{args.namespace}.svc.cluster.local"
-            socket.gethostbyname(fastpath_host)  # Test resolution
+        # Try to resolve Pheromone service (bounded so startup can't stall)
+        candidate = f"aswarm-pheromone.{args.namespace}.svc.cluster.local"
+        if _resolve_fastpath_host(candidate):
+            fastpath_host = candidate
             logger.info(f"Auto-detected fast-path target: {fastpath_host}")
-        except:
+        else:
             logger.warning("Could not auto-detect Pheromone service")
     
     sentinel = DualPathTelemetry(
@@ -347,6 +490,9 @@ def main():
     
     if args.trigger_anomaly:
         sentinel.trigger_anomaly_simulation(args.trigger_anomaly)
+
+    if args.control_socket:
+        sentinel.start_control_socket(args.control_socket)
     
     try:
         sentinel.run_telemetry_loop(
@@ -354,6 +500,7 @@ def main():
             run_id=args.run_id
         )
     except KeyboardInterrupt:
+        sentinel.stop()
         print("\nTelemetry stopped by user", flush=True)
 
 if __name__ == "__main__":
@@ -10,6 +10,11 @@ from pathlib import Path
 from collections import defaultdict, Counter
 from typing import Dict, List, Any
 
+try:
+    import orjson  # C serializer: ~5-10x faster report writes
+except ImportError:
+    orjson = None
+
 class SBOMAnalyzer:
     """Analyzer for SBOM files"""
     
@@ -141,13 +146,12 @@ class SBOMAnalyzer:
     def generate_security_summary(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate security summary across all SBOMs"""
         total_packages = sum(a.get("total_packages", 0) for a in analyses)
-        total_vulns = sum(len(a.get("vulnerabilities", [])) for a in analyses)
-        
-        # Aggregate license data
-        all_licenses = Counter()
-        for analysis in analyses:
-            for license_name, count in analysis.get("license_summary", {}).items():
-                all_licenses[license_name] += count
+        total_vulns = sum(len(a.get("vulnerabilities", ())) for a in analyses)
+
+        # Aggregate license data via Counter's C-level merge
+        all_licenses = sum(
+            (Counter(a.get("license_summary", {})) for a in analyses), Counter()
+        )
         
         return {
             "total_components_analyzed": len(analyses),
@@ -279,8 +283,12 @@ def main():
         if len(analyses) > 1:
             report["security_summary"] = analyzer.generate_security_summary(analyses)
         
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
         
         print(f"\nDetailed report saved: {args.output}")
     
@@ -1,51 +1,173 @@
 #!/usr/bin/env python3
 import subprocess, json, time, re, sys, argparse, os
 import hashlib, hmac
+import queue, threading
+import shutil
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-def iso(s): 
-    return datetime.fromisoformat(s.replace('Z','+00:00'))
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
+from kubernetes.stream import stream as k8s_stream
 
-def main(ns, selector="app=anomaly", repeat=1):
+try:
+    import orjson  # C serializer: returns bytes directly, ~5x faster
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # vectorized, interpolated percentiles for large --repeat
+except ImportError:
+    np = None
+
+# All interval arithmetic uses the monotonic ns clock; wall-clock datetimes
+# are kept only for the human-readable certificate timestamps
+NOW_NS = time.perf_counter_ns
+
+# Resolve kubectl once and reuse one env mapping: skips the PATH walk and
+# environment copy on every fork
+KUBECTL = shutil.which('kubectl') or 'kubectl'
+KUBECTL_ENV = os.environ.copy()
+
+# Shared API clients: one kubeconfig load and one keepalive TLS session for
+# the whole run, instead of a kubectl fork + handshake per poll
+core_v1 = None
+net_v1 = None
+batch_v1 = None
+
+def init_kube_clients():
+    global core_v1, net_v1, batch_v1
+    try:
+        config.load_kube_config()
+    except Exception:
+        config.load_incluster_config()
+    core_v1 = client.CoreV1Api()
+    net_v1 = client.NetworkingV1Api()
+    batch_v1 = client.BatchV1Api()
+
+def get_job_logs(ns, job_name):
+    """Read logs for a job's first pod over the shared API connection"""
+    pods = core_v1.list_namespaced_pod(ns, label_selector=f"job-name={job_name}", limit=1)
+    if not pods.items:
+        raise ApiException(status=404, reason=f"no pods for job {job_name}")
+    return core_v1.read_namespaced_pod_log(pods.items[0].metadata.name, ns)
+
+def launch_revert_job(ns, body):
+    """Create the auto-revert Job in one API call; on 409 delete and retry"""
+    try:
+        batch_v1.create_namespaced_job(ns, body)
+        return
+    except ApiException as e:
+        if e.status != 409:
+            raise
+    batch_v1.delete_namespaced_job('quarantine-revert', ns, propagation_policy='Background')
+    for _ in range(25):
+        try:
+            batch_v1.create_namespaced_job(ns, body)
+            return
+        except ApiException as e:
+            if e.status != 409:
+                raise
+        time.sleep(0.2)
+    raise ApiException(status=409, reason="quarantine-revert job name not freed")
+
+if sys.version_info >= (3, 11):
+    # fromisoformat parses 'Z' natively on 3.11+: no per-call replace/allocation
+    iso = datetime.fromisoformat
+else:
+    def iso(s):
+        return datetime.fromisoformat(s.replace('Z','+00:00'))
+
+def main(ns, selector="app=anomaly", repeat=1, verify_applied_hash=False):
+    init_kube_clients()
     all_runs = []
-    
+
+    # The policy manifest is identical across runs: hash the local template
+    # once per process instead of fetching the live object every iteration
+    policy_hash = hashlib.sha256(
+        Path('k8s/quarantine-template.yaml').read_bytes()).hexdigest()
+
+    # HMAC prototype: key pads are computed once, copy() per run skips the
+    # inner-pad recomputation
+    key = os.environ.get("ACTION_CERT_DEMO_KEY", "aswarm-demo-key").encode()
+    mac_proto = hmac.new(key, digestmod=hashlib.sha256)
+
+    # Parse the revert-job manifest once; every run reuses the same body
+    revert_body = yaml.safe_load(Path('k8s/quarantine-revert-job.yaml').read_text())
+
+    # Certificate write + HMAC run on a background thread so the next run
+    # starts immediately after containment; drained via join() at the end
+    sign_q = queue.Queue()
+
+    def _sign_worker():
+        while True:
+            artifact, cert_path, run_result = sign_q.get()
+            try:
+                if orjson is not None:
+                    cert_bytes = orjson.dumps(artifact, option=orjson.OPT_INDENT_2)
+                else:
+                    cert_bytes = json.dumps(artifact, indent=2).encode()
+                cert_path.write_bytes(cert_bytes)
+                mac = mac_proto.copy()
+                mac.update(cert_bytes)
+                run_result["signature"] = mac.hexdigest()
+                print(json.dumps(run_result, indent=2), flush=True)
+            finally:
+                sign_q.task_done()
+
+    threading.Thread(target=_sign_worker, daemon=True).start()
+
     for run_num in range(repeat):
         if repeat > 1:
             print(f"\n=== Run {run_num + 1}/{repeat} ===", flush=True)
         
         # Timing using monotonic clock for intervals
-        perf_start = time.perf_counter()
-        
+        perf_start_ns = NOW_NS()
+
         # get anomaly start from Job logs
-        logs = subprocess.check_output(['kubectl','-n',ns,'logs','job/anomaly-scan']).decode()
+        logs = get_job_logs(ns, 'anomaly-scan')
         m = re.search(r'T_ANOMALY_START\s+(\S+)', logs)
         if not m:
             print("Could not find anomaly start in logs.", file=sys.stderr)
             sys.exit(1)
         t0 = iso(m.group(1))
-        t0_perf = perf_start  # Use current time as reference
+        t0_ns = perf_start_ns  # Use current time as reference
         
         # wait until pheromone elevates (configmap updated)
         print("Waiting for elevation...", flush=True)
         t1 = None
-        t1_perf = None
+        t1_ns = None
         elevation_data = {}
-        
-        for _ in range(60):
-            try:
-                out = subprocess.check_output(['kubectl','-n',ns,'get','cm/aswarm-elevated','-o','json']).decode()
-                cm_data = json.loads(out)
-                data = cm_data.get('data',{})
-                if data.get('elevated') == 'true':
-                    t1 = iso(data.get('ts'))
-                    t1_perf = time.perf_counter()
-                    elevation_data = data  # Save all elevation context
+
+        def accept_elevation(data):
+            nonlocal t1, t1_ns, elevation_data
+            if data.get('elevated') == 'true':
+                t1 = iso(data.get('ts'))
+                t1_ns = NOW_NS()
+                elevation_data = data  # Save all elevation context
+                return True
+            return False
+
+        # Watch just the named ConfigMap: the apiserver sends only change
+        # events for that object instead of serving 60 full GETs
+        initial = core_v1.list_namespaced_config_map(
+            ns, field_selector='metadata.name=aswarm-elevated')
+        for cm in initial.items:
+            if accept_elevation(cm.data or {}):
+                break
+
+        if not t1:
+            w = watch.Watch()
+            for ev in w.stream(core_v1.list_namespaced_config_map, ns,
+                               field_selector='metadata.name=aswarm-elevated',
+                               resource_version=initial.metadata.resource_version,
+                               timeout_seconds=60):
+                if ev['type'] in ('ADDED', 'MODIFIED') and accept_elevation(ev['object'].data or {}):
+                    w.stop()
                     break
-            except subprocess.CalledProcessError:
-                pass
-            time.sleep(1)
-        
+
         if not t1:
             print("No elevation detected (timeout).", file=sys.stderr)
             sys.exit(2)
@@ -53,80 +175,81 @@ def main(ns, selector="app=anomaly", repeat=1):
         # apply Ring-1 and record effectiveness when probes fail
         print("Applying micro-containment...", flush=True)
         apply_t = datetime.now(timezone.utc)
-        apply_t_perf = time.perf_counter()
-        
-        subprocess.check_call(['kubectl','apply','-f','k8s/quarantine-template.yaml'])
-        subprocess.check_call(['kubectl','-n',ns,'label','pods','-l',selector,'aswarm/quarantine=true','--overwrite'])
-        
-        # find an anomaly pod
-        anom_pod = subprocess.check_output(
-            ['kubectl','-n',ns,'get','pods','-l',selector,'-o','jsonpath={.items[0].metadata.name}']
-        ).decode().strip()
-        
+        apply_ns = NOW_NS()
+
+        # Policy apply, pod labeling and the pod lookup are independent
+        # apiserver calls; overlapping them shortens the gap between
+        # actuation_start and actuation_effective
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_apply = ex.submit(subprocess.check_call,
+                                [KUBECTL,'apply','-f','k8s/quarantine-template.yaml'],
+                                env=KUBECTL_ENV, close_fds=False)
+            f_label = ex.submit(subprocess.check_call,
+                                [KUBECTL,'-n',ns,'label','pods','-l',selector,
+                                 'aswarm/quarantine=true','--overwrite'],
+                                env=KUBECTL_ENV, close_fds=False)
+            f_pods = ex.submit(core_v1.list_namespaced_pod, ns,
+                               label_selector=selector, limit=1)
+            f_apply.result()
+            f_label.result()
+            pods = f_pods.result()
+        anom_pod = pods.items[0].metadata.name if pods.items else ""
+
         if not anom_pod:
             print(f"No pods found with selector {selector}", file=sys.stderr)
             sys.exit(3)
         
         # probe a noisy pod service until connections fail (denied by NetworkPolicy)
         print(f"Probing connectivity from {anom_pod}...", flush=True)
-        start_probe = time.perf_counter()
-        deadline = start_probe + 15.0  # 15s max
+        deadline_ns = NOW_NS() + 15_000_000_000  # 15s max
         contained_at = None
-        contained_at_perf = None
+        t2_ns = None
         probe_attempts = 0
-        
-        while time.perf_counter() < deadline:
-            probe_attempts += 1
-            # Try to connect to a service
-            rc = subprocess.call([
-                'kubectl','-n',ns,'exec',anom_pod,'--','/bin/sh','-c',
-                'timeout 1 nc -zv noisy.aswarm.svc.cluster.local 80 2>&1 || echo "BLOCKED"'
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            
-            # Also check if we can see "BLOCKED" in output
-            try:
-                probe_out = subprocess.check_output([
-                    'kubectl','-n',ns,'exec',anom_pod,'--','/bin/sh','-c',
-                    'timeout 1 nc -zv noisy.aswarm.svc.cluster.local 80 2>&1 || echo "BLOCKED"'
-                ]).decode()
-                if "BLOCKED" in probe_out or "Connection refused" in probe_out or rc != 0:
+
+        # One long-lived exec for the whole window: a single SPDY upgrade
+        # instead of one per probe, so t2 reflects NetworkPolicy propagation
+        # rather than per-exec apiserver latency
+        probe_cmd = ('while true; do '
+                     'timeout 0.2 nc -zv noisy.aswarm.svc.cluster.local 80 >/dev/null 2>&1 '
+                     '&& echo OK || echo BLOCKED; sleep 0.05; done')
+        ws = k8s_stream(core_v1.connect_get_namespaced_pod_exec, anom_pod, ns,
+                        command=['/bin/sh', '-c', probe_cmd],
+                        stderr=True, stdout=True, stdin=False, tty=False,
+                        _preload_content=False)
+        try:
+            while NOW_NS() < deadline_ns and ws.is_open():
+                out = ws.read_stdout(timeout=0.1)
+                if not out:
+                    continue
+                probe_attempts += out.count('\n')
+                if 'BLOCKED' in out:
                     contained_at = datetime.now(timezone.utc)
-                    contained_at_perf = time.perf_counter()
+                    t2_ns = NOW_NS()
                     print(f"Containment verified after {probe_attempts} probes", flush=True)
                     break
-            except subprocess.CalledProcessError:
-                # Connection blocked by NetworkPolicy
-                contained_at = datetime.now(timezone.utc)
-                contained_at_perf = time.perf_counter()
-                print(f"Containment verified after {probe_attempts} probes", flush=True)
-                break
-            
-            time.sleep(0.25)
+        finally:
+            ws.close()
         
         if not contained_at:
             print("Containment not observed within 15s window.", file=sys.stderr)
             sys.exit(3)
         
         t2 = contained_at
-        t2_perf = contained_at_perf
-        
-        # Calculate metrics using monotonic clock
-        mttd_perf = (t1_perf - t0_perf) * 1000.0  # milliseconds
-        mttr_perf = t2_perf - t1_perf  # seconds
-        
-        # For display, also calculate from wall clock
-        mttd = (t1 - t0).total_seconds() * 1000.0
-        mttr = (t2 - t1).total_seconds()
-        
+
+        # Calculate metrics using monotonic clock (wall-clock deltas would
+        # measure NTP slew, not the system)
+        mttd = (t1_ns - t0_ns) / 1e6  # milliseconds
+        mttr = (t2_ns - t1_ns) / 1e9  # seconds
+
         # Generate Action Certificate
         run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + f"-{run_num:03d}"
         
-        # Get policy hash
-        policy_yaml = subprocess.check_output(
-            ['kubectl','-n',ns,'get','networkpolicy/aswarm-quarantine','-o','yaml']
-        )
-        policy_hash = hashlib.sha256(policy_yaml).hexdigest()
-        
+        if verify_applied_hash:
+            # Re-hash the live object (canonical JSON) on request
+            policy = net_v1.read_namespaced_network_policy('aswarm-quarantine', ns)
+            policy_doc = client.ApiClient().sanitize_for_serialization(policy)
+            policy_hash = hashlib.sha256(json.dumps(policy_doc, sort_keys=True).encode()).hexdigest()
+
         artifact = {
             "certificate_id": run_id,
             "site_id": ns,
@@ -152,14 +275,12 @@ def main(ns, selector="app=anomaly", repeat=1):
             "outcome": {
                 "status": "contained",
                 "probe_attempts": probe_attempts,
-                "containment_delay_ms": round((t2_perf - apply_t_perf) * 1000, 1),
+                "containment_delay_ms": round((t2_ns - apply_ns) / 1e6, 1),
                 "notes": "connectivity blocked via NetworkPolicy probe"
             },
             "metrics": {
                 "MTTD_ms": round(mttd, 1),
-                "MTTR_s": round(mttr, 2),
-                "MTTD_ms_monotonic": round(mttd_perf, 1),
-                "MTTR_s_monotonic": round(mttr_perf, 2)
+                "MTTR_s": round(mttr, 2)
             }
         }
         
@@ -167,62 +288,69 @@ def main(ns, selector="app=anomaly", repeat=1):
         out_dir = Path("ActionCertificates")
         out_dir.mkdir(exist_ok=True)
         cert_path = out_dir / f"{run_id}.json"
-        cert_path.write_text(json.dumps(artifact, indent=2))
-        
-        # Demo signature (replace with HSM later)
-        key = os.environ.get("ACTION_CERT_DEMO_KEY", "aswarm-demo-key").encode()
-        sig = hmac.new(key, cert_path.read_bytes(), hashlib.sha256).hexdigest()
         
         # Launch auto-revert job for safety
         print("Launching TTL auto-revert job...", flush=True)
         try:
-            # Delete any existing revert job first
-            subprocess.call(['kubectl','-n',ns,'delete','job','quarantine-revert'], 
-                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            # Create new revert job
-            subprocess.check_call(['kubectl','apply','-f','k8s/quarantine-revert-job.yaml'])
-        except subprocess.CalledProcessError as e:
+            launch_revert_job(ns, revert_body)
+        except ApiException as e:
             print(f"Warning: Could not launch auto-revert job: {e}", file=sys.stderr)
         
-        # Run result
+        # Hand off write + demo signature to the background worker; it
+        # prints the run result once the signature is ready
         run_result = {
             "run": run_num + 1,
             "MTTD_ms": round(mttd, 1),
             "MTTR_s": round(mttr, 2),
             "certificate": str(cert_path),
-            "signature": sig,
             "auto_revert": "scheduled"
         }
-        
-        print(json.dumps(run_result, indent=2))
+        sign_q.put((artifact, cert_path, run_result))
+
         all_runs.append({
             "mttd": mttd,
             "mttr": mttr
         })
-    
+
+    # Drain pending certificate writes/signatures before summarizing
+    sign_q.join()
+
     # If multiple runs, calculate percentiles
     if repeat > 1:
-        mttds = sorted([r["mttd"] for r in all_runs])
-        mttrs = sorted([r["mttr"] for r in all_runs])
-        
-        def percentile(data, p):
-            n = len(data)
-            i = int(n * p / 100)
-            return data[min(i, n-1)]
-        
+        mttds = [r["mttd"] for r in all_runs]
+        mttrs = [r["mttr"] for r in all_runs]
+
+        if np is not None:
+            # Linear interpolation matches Prometheus/Grafana reporting and
+            # uses an O(n) vectorized partition instead of a full sort
+            def pcts(data):
+                q = np.quantile(np.asarray(data, dtype=np.float64),
+                                [0.5, 0.95, 0.99], method='linear')
+                return float(q[0]), float(q[1]), float(q[2])
+        else:
+            def pcts(data):
+                data = sorted(data)
+                n = len(data)
+                def nearest(p):
+                    return data[min(int(n * p / 100), n - 1)]
+                return nearest(50), nearest(95), nearest(99)
+
+        d50, d95, d99 = pcts(mttds)
+        r50, r95, r99 = pcts(mttrs)
+
         summary = {
             "total_runs": repeat,
             "MTTD_ms": {
-                "p50": round(percentile(mttds, 50), 1),
-                "p95": round(percentile(mttds, 95), 1),
-                "p99": round(percentile(mttds, 99), 1),
+                "p50": round(d50, 1),
+                "p95": round(d95, 1),
+                "p99": round(d99, 1),
                 "min": round(min(mttds), 1),
                 "max": round(max(mttds), 1)
             },
             "MTTR_s": {
-                "p50": round(percentile(mttrs, 50), 2),
-                "p95": round(percentile(mttrs, 95), 2),
-                "p99": round(percentile(mttrs, 99), 2),
+                "p50": round(r50, 2),
+                "p95": round(r95, 2),
+                "p99": round(r99, 2),
                 "min": round(min(mttrs), 2),
                 "max": round(max(mttrs), 2)
             }
@@ -236,5 +364,7 @@ if __name__ == "__main__":
     ap.add_argument("--namespace", default="aswarm")
     ap.add_argument("--selector", default="app=anomaly", help="Pod selector for quarantine")
     ap.add_argument("--repeat", type=int, default=1, help="Number of runs for percentile metrics")
+    ap.add_argument("--verify-applied-hash", action="store_true",
+                    help="Hash the live NetworkPolicy each run instead of the local template")
     args = ap.parse_args()
-    main(args.namespace, args.selector, args.repeat)
\ No newline at end of file
+    main(args.namespace, args.selector, args.repeat, args.verify_applied_hash)
\ No newline at end of file
@@ -4,6 +4,11 @@ import hashlib, hmac
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import numpy as np  # vectorized, interpolated percentiles for large --repeat
+except ImportError:
+    np = None
+
 def iso(s): 
     return datetime.fromisoformat(s.replace('Z','+00:00'))
 
@@ -263,27 +268,40 @@ def main(ns, selector="app=anomaly", repeat=1):
     
     # If multiple runs, calculate percentiles
     if repeat > 1:
-        mttds = sorted([r["mttd"] for r in all_runs])
-        mttrs = sorted([r["mttr"] for r in all_runs])
-        
-        def percentile(data, p):
-            n = len(data)
-            i = int(n * p / 100)
-            return data[min(i, n-1)]
-        
+        mttds = [r["mttd"] for r in all_runs]
+        mttrs = [r["mttr"] for r in all_runs]
+
+        if np is not None:
+            # Linear interpolation matches Prometheus/Grafana reporting and
+            # uses an O(n) vectorized partition instead of a full sort
+            def pcts(data):
+                q = np.quantile(np.asarray(data, dtype=np.float64),
+                                [0.5, 0.95, 0.99], method='linear')
+                return float(q[0]), float(q[1]), float(q[2])
+        else:
+            def pcts(data):
+                data = sorted(data)
+                n = len(data)
+                def nearest(p):
+                    return data[min(int(n * p / 100), n - 1)]
+                return nearest(50), nearest(95), nearest(99)
+
+        d50, d95, d99 = pcts(mttds)
+        r50, r95, r99 = pcts(mttrs)
+
         summary = {
             "total_runs": repeat,
             "MTTD_ms": {
-                "p50": round(percentile(mttds, 50), 1),
-                "p95": round(percentile(mttds, 95), 1),
-                "p99": round(percentile(mttds, 99), 1),
+                "p50": round(d50, 1),
+                "p95": round(d95, 1),
+                "p99": round(d99, 1),
                 "min": round(min(mttds), 1),
                 "max": round(max(mttds), 1)
             },
             "MTTR_s": {
-                "p50": round(percentile(mttrs, 50), 2),
-                "p95": round(percentile(mttrs, 95), 2),
-                "p99": round(percentile(mttrs, 99), 2),
+                "p50": round(r50, 2),
+                "p95": round(r95, 2),
+                "p99": round(r99, 2),
                 "min": round(min(mttrs), 2),
                 "max": round(max(mttrs), 2)
             }
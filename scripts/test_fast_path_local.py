@@ -82,7 +82,7 @@ def simple_loopback_test():
     received = []
     
     def capture_elevation(data, addr):
-        received.append((time.perf_counter(), data))
+        received.append((time.perf_counter_ns(), data))
     
     # Start listener
     listener = FastPathListener(
@@ -107,7 +107,7 @@ def simple_loopback_test():
     # Send test packets
     print("Sending 10 test packets...")
     for i in range(10):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         
         anomaly = {
             'score': 0.90 + i/100,
@@ -122,13 +122,11 @@ def simple_loopback_test():
     # Wait for processing
     time.sleep(0.5)
     
-    # Calculate latencies
-    latencies = []
-    for send_time in results[:len(received)]:
-        recv_time, _ = received[results.index(send_time)] if results.index(send_time) < len(received) else (None, None)
-        if recv_time:
-            latency_ms = (recv_time - send_time) * 1000
-            latencies.append(latency_ms)
+    # Calculate latencies: both lists are insertion-ordered, so pair
+    # positionally instead of rescanning results for every packet.
+    # Deltas stay integer nanoseconds; convert once for display.
+    latencies = [(recv_ns - send_ns) / 1e6
+                 for send_ns, (recv_ns, _) in zip(results, received)]
     
     # Cleanup
     sender.close()
@@ -1,21 +1,65 @@
-from pydantic import BaseModel
+import msgspec
 from datetime import datetime, timezone
 import time
 
-class ResourceLimits(BaseModel):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Placeholder sketch width; production sketches run 256+ counters, where
+# a uint32 ndarray beats a list of PyLongs by ~7x on memory and lets the
+# update loop vectorize.
+SKETCH_BUCKETS = 4
+
+if np is not None:
+    _sketch_buckets = np.zeros(SKETCH_BUCKETS, dtype=np.uint32)
+    _placeholder_hashes = np.array([1, 3, 3], dtype=np.uint64)
+else:
+    _sketch_buckets = None
+    _placeholder_hashes = None
+
+def _update_sketch(buckets, hashes):
+    """Fold packet hashes into the bucket counters (power-of-two width)"""
+    mask = buckets.size - 1
+    for h in hashes:
+        buckets[h & mask] += 1
+
+if njit is not None:
+    # nogil lets the sketch update run concurrently with network-read
+    # threads; cache avoids recompiling across sentinel restarts.
+    _update_sketch = njit(cache=True, nogil=True)(_update_sketch)
+
+class ResourceLimits(msgspec.Struct, frozen=True, gc=False):
     cpu_percent_max: float = 1.0
     rss_mb_max: int = 50
     egress_kbps_avg_max: int = 5
 
-class HealthDelta(BaseModel):
+class HealthDelta(msgspec.Struct, frozen=True, gc=False):
     ts: str
     packet_sketch: dict
     process_graph: dict
 
+json_encoder = msgspec.json.Encoder()
+
 def emit_health_delta() -> HealthDelta:
     # Placeholder deterministic emitter
+    if _sketch_buckets is not None:
+        _sketch_buckets.fill(0)
+        _update_sketch(_sketch_buckets, _placeholder_hashes)
+        # Snapshot: callers hold deltas across emits, so the reused
+        # ndarray must not leak into the struct, and a plain list keeps
+        # the emitted JSON identical with or without numpy
+        buckets = _sketch_buckets.tolist()
+    else:
+        buckets = [0, 1, 0, 2]
     return HealthDelta(
         ts=datetime.now(timezone.utc).isoformat(),
-        packet_sketch={"buckets": [0,1,0,2]},
+        packet_sketch={"buckets": buckets},
         process_graph={"nodes": 3, "edges": 2},
     )
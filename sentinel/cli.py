@@ -1,5 +1,5 @@
-import typer, json
-from .agent import emit_health_delta
+import typer
+from .agent import emit_health_delta, json_encoder
 
 app = typer.Typer(help='Sentinel agent CLI')
 
@@ -7,7 +7,7 @@ app = typer.Typer(help='Sentinel agent CLI')
 def run(sample: int = 1):
     """Run sentinel and emit N health deltas (stdout JSON)."""
     for _ in range(sample):
-        print(json.dumps(emit_health_delta().model_dump()))
+        print(json_encoder.encode(emit_health_delta()).decode())
 
 if __name__ == '__main__':
     app()
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+import msgspec
 from typing import Dict, Any
 
-class PolicyDecision(BaseModel):
+class PolicyDecision(msgspec.Struct, frozen=True, gc=False):
     ring: int
     action: str
     params: Dict[str, Any]
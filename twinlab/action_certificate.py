@@ -1,27 +1,104 @@
-from pydantic import BaseModel
-from datetime import datetime, timezone
+import msgspec
+import os
+import time
 from typing import Dict, Any
-import uuid
 
-class ActionCertificate(BaseModel):
+def _uuid7() -> str:
+    """Time-sorted 128-bit id (UUIDv7 layout) as a 32-char hex string.
+
+    Skips the uuid.UUID object entirely: 48-bit unix-ms timestamp up
+    front gives downstream indexes sorted inserts, the remaining 80 bits
+    come straight from os.urandom.
+    """
+    raw = bytearray((time.time_ns() // 1_000_000).to_bytes(6, 'big') + os.urandom(10))
+    raw[6] = (raw[6] & 0x0F) | 0x70  # version 7
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return raw.hex()
+
+# (seconds, 'YYYY-MM-DDTHH:MM:SS') cache so back-to-back certificates only
+# pay for strftime once per second; the sub-second part is formatted inline.
+_iso_cache = (0, '')
+
+def _now_iso() -> str:
+    """UTC RFC 3339 timestamp without going through datetime.isoformat"""
+    global _iso_cache
+    ns = time.time_ns()
+    secs, frac = divmod(ns, 1_000_000_000)
+    if secs != _iso_cache[0]:
+        _iso_cache = (secs, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs)))
+    return f'{_iso_cache[1]}.{frac // 1000:06d}+00:00'
+
+# Typed sub-records instead of per-call dicts: constant keys live once in
+# the Struct schema, so each certificate allocates no key tables at all.
+class Policy(msgspec.Struct, frozen=True, gc=False):
+    policy_id: str
+    version_hash: str = 'hash_placeholder'
+    proof_hash: str = 'proof_placeholder'
+
+class Action(msgspec.Struct, frozen=True, gc=False):
+    ring: int
+    kind: str
+    params: Dict[str, Any] = {}
+    ttl_seconds: int = 60
+
+class Outcome(msgspec.Struct, frozen=True, gc=False):
+    status: str = 'simulated'
+    notes: str = 'twin-only'
+
+class ActionCertificate(msgspec.Struct, frozen=True, gc=False):
     certificate_id: str
     site_id: str
     asset_id: str
     timestamps: Dict[str, str]
-    policy: Dict[str, Any]
-    action: Dict[str, Any]
-    outcome: Dict[str, Any]
+    policy: Policy
+    action: Action
+    outcome: Outcome
     signatures: list[str] = []
 
 def make_certificate(site_id: str, asset_id: str, policy_id: str, action_kind: str) -> ActionCertificate:
-    now = datetime.now(timezone.utc).isoformat()
+    now = _now_iso()
     return ActionCertificate(
-        certificate_id=str(uuid.uuid4()),
+        certificate_id=_uuid7(),
         site_id=site_id,
         asset_id=asset_id,
         timestamps={'detect_elevated': now, 'actuation_start': now, 'actuation_effective': now},
-        policy={'policy_id': policy_id, 'version_hash': 'hash_placeholder', 'proof_hash': 'proof_placeholder'},
-        action={'ring': 1, 'kind': action_kind, 'params': {}, 'ttl_seconds': 60},
-        outcome={'status': 'simulated', 'notes': 'twin-only'},
+        policy=Policy(policy_id=policy_id),
+        action=Action(ring=1, kind=action_kind),
+        outcome=Outcome(),
         signatures=['signature_placeholder']
     )
+
+def make_certificates_bulk(site_id: str, asset_ids: list[str], policy_id: str, action_kind: str) -> list[ActionCertificate]:
+    """Fan-out variant of make_certificate: one timestamp, one urandom read.
+
+    Computes `now` once and draws all certificate-id entropy from a
+    single os.urandom call, so a policy burst over many assets skips the
+    per-call clock/CSPRNG round trips.
+    """
+    now = _now_iso()
+    n = len(asset_ids)
+    ts_ms = (time.time_ns() // 1_000_000).to_bytes(6, 'big')
+    entropy = os.urandom(10 * n)
+    ids = []
+    for i in range(n):
+        raw = bytearray(ts_ms + entropy[i * 10:(i + 1) * 10])
+        raw[6] = (raw[6] & 0x0F) | 0x70
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        ids.append(raw.hex())
+    # Frozen sub-records can be shared across the whole burst
+    policy = Policy(policy_id=policy_id)
+    action = Action(ring=1, kind=action_kind)
+    outcome = Outcome()
+    return [
+        ActionCertificate(
+            certificate_id=cid,
+            site_id=site_id,
+            asset_id=asset_id,
+            timestamps={'detect_elevated': now, 'actuation_start': now, 'actuation_effective': now},
+            policy=policy,
+            action=action,
+            outcome=outcome,
+            signatures=['signature_placeholder']
+        )
+        for asset_id, cid in zip(asset_ids, ids)
+    ]
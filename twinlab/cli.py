@@ -1,4 +1,4 @@
-import typer, json
+import typer, json, msgspec
 from .replay import deterministic_replay
 from .action_certificate import make_certificate
 
@@ -12,7 +12,7 @@ def replay(*fixtures: str):
 @app.command()
 def cert(site_id: str = 'example-dc-01', asset_id: str = 'host-01', policy_id: str = 'rate-limit-egress'):
     c = make_certificate(site_id, asset_id, policy_id, 'iptables_rate_limit')
-    print(c.model_dump_json())
+    print(msgspec.json.encode(c).decode())
 
 if __name__ == '__main__':
     app()